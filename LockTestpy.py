@@ -1,91 +1,429 @@
 import os
-import random
+import argparse
+import gc
 import tkinter as tk
-from tkinter import messagebox, font, ttk
-from PIL import Image, ImageTk
-import vlc
-import pyautogui
+from tkinter import messagebox, ttk
 import sys
+import math
+import time
+import queue
 import logging
+import threading
+from app_config import ConfigWatcher, load_config
+from app_logging import log_message, set_log_level, setup_logging
+from player_pool import PlayerPool
+from media_index import MediaIndex
+from video_scanner import VideoScanner, parse_extensions
+from window_pool import PopupWindowPool
+from selection import RecentWindow, ShuffleBag, load_weights
+from font_cache import FontCache
+from popup_scheduler import PopupAdmission
+from playback_stats import PlaybackStats
+from playback_profiles import apply_options, popup_media_options
+from proxy_videos import CONTENT_HASH_FILE, PROXY_DIR, ProxyLibrary, popup_box
+from popup_workers import PopupWorkerPool
+from event_bridge import EventBridge
+from popup_placement import PopupPlacer
+from session_journal import SessionJournal, SessionReplay, new_seed, session_rng
+from resource_tracker import current_rss, resources
+from video_import import ContentHashIndex
 
-LOG_FILE = "Log.txt"
-CONFIG_FILE = "config.txt"
-DEFAULT_PASSWORD = "password"
 DEFAULT_VIDEO_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "videos")
 CUSTOM_VIDEO_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "custom_videos")
-
-logging.basicConfig(filename=LOG_FILE, level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
-
-def log_message(message, level=logging.INFO):
-    logging.log(level, message)
-
-def load_config():
-    config = {}
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as config_file:
-                config = dict(line.strip().split('=', 1) for line in config_file if '=' in line)
-            log_message(f"Loaded configuration: {config}")
-        except Exception as e:
-            log_message(f"Error loading configuration: {e}", level=logging.ERROR)
-    return config
+MEDIA_INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "media_index.json")
+VIDEO_MANIFEST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "video_manifest.json")
+PLAY_HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "play_history.json")
+PLAYBACK_METRICS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "playback_metrics.json")
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journals")
+TEXT_STATS_EVERY = 500  # Text pop-ups between cache statistics log lines
+CONFIG_POLL_MS = 2000
+STATS_SAMPLE_MS = 2000
+WORKER_POLL_MS = 100
+METRICS_SAVE_EVERY = 15  # Samples between writes of the metrics file
+RESOURCE_CHECK_MS = 60000
+SWEEP_KEEP = 2  # Idle players and pop-up windows left in the pools by a cleanup sweep
+VLC_ARGS = ("--no-xlib", "--quiet")
+
+# libVLC, pyautogui and PIL are slow to import, so they are loaded on a worker
+# thread (while the warning dialog is up, or while the configurator is open)
+vlc = None
+pyautogui = None
+_heavy_imports = None
+_preloaded_instance = None
+
+
+def _load_heavy_modules():
+    global vlc, pyautogui, _preloaded_instance
+    started = time.perf_counter()
+    import vlc
+    import pyautogui
+    from PIL import ImageTk  # Warms the import image_assets needs for the screensaver
+    _preloaded_instance = vlc.Instance(*VLC_ARGS)
+    log_message("Loaded libVLC and input modules in %.0f ms", (time.perf_counter() - started) * 1000)
+
+
+def _load_heavy_modules_in_background():
+    try:
+        _load_heavy_modules()
+    except Exception as e:
+        # take_vlc_instance() retries on the calling thread, where the error is reported
+        log_message("Background import failed: %s", e, level=logging.WARNING)
+
+
+def start_heavy_imports():
+    global _heavy_imports
+    if _heavy_imports is None:
+        _heavy_imports = threading.Thread(target=_load_heavy_modules_in_background, name="HeavyImports", daemon=True)
+        _heavy_imports.start()
+
+
+def take_vlc_instance():
+    """Wait for the background imports and hand over the libVLC instance they created."""
+    global _preloaded_instance
+    start_heavy_imports()
+    _heavy_imports.join()
+    if _preloaded_instance is None and (vlc is None or pyautogui is None):
+        _load_heavy_modules()
+    instance, _preloaded_instance = _preloaded_instance, None
+    return instance or vlc.Instance(*VLC_ARGS)
+
+
+def confirm_start(parent=None):
+    return messagebox.askyesno(
+        "Warning",
+        "This program will play videos continuously until you type the correct password, press the ESC key, or the timer runs out. Do you want to continue?",
+        parent=parent
+    )
 
 class LockApp:
-    def __init__(self, master, config):
+    def __init__(self, master, config, on_exit=None, replay=None):
+        self.launch_started = time.perf_counter()
         self.master = master
+        self.on_exit = on_exit
         self.config = config
-        self.correct_password = config.get("password", DEFAULT_PASSWORD)
-        self.use_default_videos = config.get("use_default_videos", "True") == "True"
-        self.timer_duration = int(config.get("timer", 0)) if config.get("timer") else 0
-        self.timer_position = config.get("timer_position", "top_right")
-        self.theme_name = config.get("theme", "Light")
-        self.mode = config.get("mode", "fullscreen")
-        self.bg_color = config.get("bg_color", "#000000")
-        self.screensaver_image_path = config.get("screensaver_image_path", "")
-        self.popup_text_file = config.get("popup_text_file", "")
-        self.popup_interval = float(config.get("popup_interval", 0.5))
-        self.popup_duration = float(config.get("popup_duration", 5))
-        self.popup_video_size_percent = int(config.get("popup_video_size", 5)) / 20
-        self.show_skip_button = config.get("show_skip_button", "True") == "True"
-        self.show_password = config.get("show_password", "True") == "True"
+        self.replay = replay
+        # Every random choice comes from a stream derived from the seed, see session_journal.py
+        self.session_seed = replay.seed if replay else (config["session_seed"] or new_seed())
+        self.journal = SessionJournal(JOURNAL_DIR, self.session_seed, config, replay_of=replay.path if replay else None)
+        self.text_rng = session_rng(self.session_seed, "text")
+        self.offset_rng = session_rng(self.session_seed, "offsets")
+        self.config_watcher = ConfigWatcher(values=config)
+        self.correct_password = config["password"]
+        self.use_default_videos = config["use_default_videos"]
+        self.timer_duration = config["timer"]
+        self.timer_position = config["timer_position"]
+        self.theme_name = config["theme"]
+        self.mode = config["mode"]
+        self.bg_color = config["bg_color"]
+        self.screensaver_image_path = config["screensaver_image_path"]
+        self.popup_text_file = config["popup_text_file"]
+        self.popup_interval = config["popup_interval"]
+        self.popup_duration = config["popup_duration"]
+        self.popup_video_size = config["popup_video_size"]
+        self.show_skip_button = config["show_skip_button"]
+        self.show_password = config["show_password"]
+        self.player_pool_size = config["player_pool_size"]
+        self.popup_window_pool_size = config["popup_window_pool_size"]
+        self.max_popup_players = config["max_popup_players"]
+        self.adaptive_popups = config["adaptive_popups"]
+        self.popup_audio = config["popup_audio"]
+        self.popup_decoder_threads = config["popup_decoder_threads"]
+        self.popup_skip_loop_filter = config["popup_skip_loop_filter"]
+        self.popup_skip_frame = config["popup_skip_frame"]
+        self.popup_worker_processes = config["popup_worker_processes"]
+        self.popup_overlap_tolerance = config["popup_overlap_tolerance"]
+        self.cleanup_growth_mb = config["cleanup_growth_mb"]
+        self.rss_baseline = None
+        self.audio_leader = None
         self.video_folder = DEFAULT_VIDEO_FOLDER if self.use_default_videos else CUSTOM_VIDEO_FOLDER
+        self.video_extensions = parse_extensions(config["video_extensions"])
+        self.video_scanner = None
+        self.video_weights_file = config["video_weights_file"]
+        self.no_repeat_window = config["no_repeat_window"]
         self.popups = []
+        self.text_bag = ShuffleBag(rng=self.text_rng)
         self.popup_windows = []
         self.popup_job = None
         self.text_popup_job = None
         self.timer_running = False
         self.time_left = self.timer_duration
+        self.timer_deadline = None
+        self.timer_next_tick = None
+        self.timer_overrun = None
+        self.timer_max_lateness = 0.0
         self.timer_label = None
+        self.timer_screen_size = None
         self.player = None
+        self.list_player = None
+        self.media_list = None
+        self.playlist_paths = []
+        # Every libVLC callback reaches the Tk thread through this, see event_bridge.py
+        self.event_bridge = EventBridge(master)
+        self.player_events = None
+        self.list_player_events = None
+        self.player_event_manager = None
+        self.first_frame_attached = False
         self.instance = None
+        self.player_pool = None
+        self.window_pool = None
+        self.popup_workers = None
+        self.proxies = None
+        self.font_cache = None
+        self.placer = None
+        self.screen = (master.winfo_screenwidth(), master.winfo_screenheight())
+        self.popup_admission = PopupAdmission(self.max_popup_players, self.adaptive_popups)
+        self.media_index = MediaIndex(MEDIA_INDEX_FILE)
+        self.playback_stats = PlaybackStats(PLAYBACK_METRICS_FILE)
+        self.stats_samples = 0
+        self.now_playing = None
         self.screensaver_label = None
         self.screensaver_image = None
+        self.screensaver_cache = None
         self.current_videos = []
+        # One bag and no-repeat window shared by the fullscreen and pop-up players
+        self.recent_videos = RecentWindow(self.no_repeat_window)
+        self.recent_videos.load(PLAY_HISTORY_FILE)
+        self.video_weights = load_weights(self.video_weights_file) if self.video_weights_file else {}
+        self.video_bag = ShuffleBag(weight=self.video_weight, recent=self.recent_videos,
+                                    rng=session_rng(self.session_seed, "videos"))
         self.is_screensaver_active = False
         self.fullscreen_controls_visible = True  # Initially visible in fullscreen
         self.controls_hide_timer = None
-        self.show_popup_bg = config.get("show_popup_bg", "True") == "True"
+        self.show_popup_bg = config["show_popup_bg"]
         self.popup_background_window = None  # For popup mode background
         self.fullscreen_controls_visible_forced = False # Flag for forced visibility
         self._playback_before_screensaver = False
+        self.first_frame_logged = False
+        self.startup_marks = {}
+
+        self.closed = False
 
-        log_message(f"Loaded password: {self.correct_password}")
+        log_message("Loaded password: %s", self.correct_password)
+
+        try:
+            self.start_session()
+        except Exception:
+            # Stop the loops, threads and players started before the failure;
+            # the start-up error is the one re-raised, whatever cleanup hits
+            try:
+                self.unlock_input()
+                self.shutdown()
+            except Exception as e:
+                log_message("Error cleaning up after a failed start: %s", e, level=logging.ERROR)
+            raise
+        self.master.focus_force()
 
+    def start_session(self):
+        self.instance = resources.track("vlc_instance", take_vlc_instance())
+        self.mark_startup("libVLC ready")
+        # Scan before building the UI; setup_ui starts the first video as soon as
+        # the video frame exists, while the rest of the widgets are created
+        self.media_index.start()
+        self.load_videos()
+        self.event_bridge.start()
         self.setup_ui()
+        self.mark_startup("UI built")
         if self.mode == "fullscreen":
             self.master.after(100, self.hide_fullscreen_controls)
         self.lock_input()
-        self.load_videos()
-        self.start_video_playback()
+        if self.mode == "fullscreen":
+            from image_assets import FittedImage  # PIL is warm by now, see _load_heavy_modules
+            # Decode and fit the screensaver image now, so F1 only has to show it
+            self.screensaver_cache = FittedImage(self.master)
+            self.preload_screensaver()
+        if self.mode == "windowed":
+            if self.popup_worker_processes:
+                # Pop-up windows and their players live in worker processes, see popup_workers.py
+                self.popup_workers = PopupWorkerPool(self.popup_worker_processes, pool_size=self.player_pool_size)
+                self.popup_workers.start()
+                self.master.after(WORKER_POLL_MS, self.poll_popup_workers)
+            else:
+                self.player_pool = PlayerPool(self.instance, max_size=self.player_pool_size)
+            self.window_pool = PopupWindowPool(self.master, size=self.popup_window_pool_size)
+            self.font_cache = FontCache(self.master)
+            self.proxies = ProxyLibrary(PROXY_DIR, ContentHashIndex(CONTENT_HASH_FILE))
+            self.placer = PopupPlacer(*self.screen, tolerance=self.popup_overlap_tolerance,
+                                      rng=session_rng(self.session_seed, "placement"))
+        self.poll_video_scanner()
         if self.timer_duration > 0:
             self.start_timer()
         if self.mode == "windowed" and self.popup_text_file:
             self.create_popup_background()
             self.load_popups()
             self.schedule_popups()
+        self.master.after(CONFIG_POLL_MS, self.check_config)
+        self.master.after(STATS_SAMPLE_MS, self.sample_playback_stats)
+        self.master.after(RESOURCE_CHECK_MS, self.check_resources)
+        if self.replay:
+            # Config changes are replayed in every mode, pop-ups only where they were recorded
+            self.replay.start(self, self.journal.started)
+
+    def mark_startup(self, milestone):
+        self.startup_marks[milestone] = time.perf_counter() - self.launch_started
+
+    def on_first_frame(self, event):
+        # Called on a libVLC thread; logging is thread-safe
+        if not self.first_frame_logged:
+            self.first_frame_logged = True
+            self.mark_startup("first frame")
+            log_message("Time to first frame: %.0f ms (%s)", self.startup_marks["first frame"] * 1000,
+                        ", ".join(f"{name} at {seconds * 1000:.0f} ms" for name, seconds in self.startup_marks.items()
+                                  if name != "first frame"))
+
+    def detach_first_frame(self):
+        # On the Tk thread: detaching from inside the libVLC callback would deadlock
+        if self.first_frame_attached:
+            self.player_event_manager.event_detach(vlc.EventType.MediaPlayerVout)
+            self.first_frame_attached = False
+
+    def request_exit(self):
+        if self.on_exit:
+            self.on_exit()
+        else:
+            self.master.quit()
 
-        self.master.focus_force()
+    def check_config(self):
+        # Apply edits to config.txt without restarting (and re-creating every VLC player);
+        # a replay takes its config changes from the journal instead
+        if self.closed:
+            return
+        changes = None if self.replay else self.config_watcher.poll()
+        if changes:
+            self.journal.record("config", changes=changes)
+            self.apply_config_changes(changes)
+        self.journal.flush()
+        if self.refresh_screen_size():
+            self.position_timer_label()
+        self.preload_screensaver()  # Also picks up a replaced image file
+        self.master.after(CONFIG_POLL_MS, self.check_config)
+
+    def sample_playback_stats(self):
+        if self.closed:
+            return
+        if self.first_frame_logged:
+            self.detach_first_frame()
+        if self.player:
+            media = self.player.get_media()
+            if media is not None:
+                try:
+                    video = self.main_video_path(media)
+                    self.playback_stats.sample(("main", video), media, video, self.mode)
+                finally:
+                    media.release()
+        for window in self.popup_windows:
+            if getattr(window, 'media', None):
+                self.playback_stats.sample(window, window.media, window.video, "popup")
+        self.stats_samples += 1
+        if self.stats_samples % METRICS_SAVE_EVERY == 0:
+            self.playback_stats.save()
+        self.master.after(STATS_SAMPLE_MS, self.sample_playback_stats)
+
+    def check_resources(self):
+        if self.closed:
+            return
+        rss = current_rss()
+        log_message("Resources: RSS %s, %s", f"{rss / 2 ** 20:.0f} MB" if rss else "unknown", resources.describe())
+        if rss is not None:
+            # The first check, a minute in, is the baseline: caches and pools are warm by then
+            if self.rss_baseline is None:
+                self.rss_baseline = rss
+            elif self.cleanup_growth_mb and rss - self.rss_baseline > self.cleanup_growth_mb * 2 ** 20:
+                self.cleanup_sweep(rss)
+        self.master.after(RESOURCE_CHECK_MS, self.check_resources)
+
+    def cleanup_sweep(self, rss):
+        # Drop everything that is rebuilt on demand, then measure again
+        if self.player_pool:
+            self.player_pool.trim(SWEEP_KEEP)
+        if self.window_pool:
+            self.window_pool.trim(SWEEP_KEEP)
+        if self.font_cache:
+            self.font_cache.clear()
+        gc.collect()
+        after = current_rss() or rss
+        log_message("Memory grew %.0f MB since the baseline; cleanup sweep took RSS from %.0f MB to %.0f MB (%s)",
+                    (rss - self.rss_baseline) / 2 ** 20, rss / 2 ** 20, after / 2 ** 20, resources.describe(),
+                    level=logging.WARNING)
+        self.rss_baseline = after
+
+    def main_video_path(self, media):
+        if self.media_list:
+            index = self.playlist_index(media)
+            return self.playlist_paths[index] if index >= 0 else None
+        return self.now_playing
+
+    def playlist_index(self, media):
+        # The media list player's thread reads the list too; libVLC requires the lock
+        self.media_list.lock()
+        try:
+            return self.media_list.index_of_item(media)
+        finally:
+            self.media_list.unlock()
+
+    def apply_config_changes(self, changes):
+        popup_profile_keys = ("popup_audio", "popup_decoder_threads", "popup_skip_loop_filter", "popup_skip_frame")
+        live_keys = ("popup_interval", "popup_duration", "popup_video_size", "volume", "playback_speed",
+                     "bg_color", "screensaver_image_path", "popup_overlap_tolerance",
+                     "cleanup_growth_mb") + popup_profile_keys
+        for key, value in changes.items():
+            if key in popup_profile_keys:
+                setattr(self, key, value)  # Applies to the next pop-up
+            elif key == "popup_interval":
+                self.popup_interval = value
+            elif key == "popup_duration":
+                self.popup_duration = value
+            elif key == "popup_video_size":
+                self.popup_video_size = value
+            elif key == "volume":
+                self.volume_var.set(value)
+                self.update_volume(value)
+            elif key == "playback_speed":
+                self.playback_speed_var.set(value)
+                self.update_playback_speed(value)
+            elif key == "bg_color":
+                self.apply_bg_color(value)
+            elif key == "screensaver_image_path":
+                self.screensaver_image_path = value
+            elif key == "cleanup_growth_mb":
+                self.cleanup_growth_mb = value
+            elif key == "popup_overlap_tolerance":
+                self.popup_overlap_tolerance = value
+                if self.placer:
+                    self.placer.tolerance = value
+        applied = [key for key in changes if key in live_keys]
+        pending = [key for key in changes if key not in live_keys]
+        if applied:
+            log_message("Applied configuration changes: %s", ", ".join(applied))
+        if pending:
+            log_message("Configuration changes that need a restart: %s", ", ".join(pending))
+
+    def screen_size(self):
+        return self.screen
+
+    def refresh_screen_size(self):
+        # The screen size is cached; this re-reads it and reports whether it changed
+        screen = (self.master.winfo_screenwidth(), self.master.winfo_screenheight())
+        if screen == self.screen:
+            return False
+        log_message("Screen size changed to %dx%d", *screen)
+        self.screen = screen
+        if self.placer:
+            self.placer.resize(*screen)
+        return True
+
+    def preload_screensaver(self):
+        if self.screensaver_cache and self.screensaver_image_path:
+            self.screensaver_cache.preload(self.screensaver_image_path, self.screen_size())
+
+    def apply_bg_color(self, bg_color):
+        self.bg_color = bg_color
+        if self.mode == "fullscreen":
+            self.style.configure('Fullscreen.TFrame', background=bg_color)
+        else:
+            self.master.config(bg=bg_color)
+            self.style.configure('TLabel', background=bg_color)
+            if self.popup_background_window:
+                self.popup_background_window.config(bg=bg_color)
 
     def create_popup_background(self):
         if self.mode == "windowed":
@@ -130,8 +468,13 @@ class LockApp:
 
         self.style.configure('Transparent.TFrame', background='')
 
+        self.playback_speed_var = tk.DoubleVar(value=self.config["playback_speed"])
+        self.volume_var = tk.IntVar(value=self.config["volume"])
+
         self.video_frame = tk.Frame(self.master, bg='black')
         self.video_frame.pack(fill="both", expand=True)
+        if self.video_scanner:
+            self.drain_video_scanner()  # Opens the first video now if the scan already found one
 
         # Navigation frame
         self.nav_frame = ttk.Frame(self.master, style='Transparent.TFrame')
@@ -162,13 +505,11 @@ class LockApp:
             self.skip_button.pack(side="left", padx=5)
 
         ttk.Label(self.nav_controls, text="Speed:").pack(side="left", padx=5)
-        self.playback_speed_var = tk.DoubleVar(value=1.0)
         self.playback_speed_scale = ttk.Scale(self.nav_controls, from_=0.5, to=2.0, orient=tk.HORIZONTAL,
                                              variable=self.playback_speed_var, command=self.update_playback_speed)
         self.playback_speed_scale.pack(side="left", padx=5)
 
         ttk.Label(self.nav_controls, text="Volume:").pack(side="left", padx=5)
-        self.volume_var = tk.IntVar(value=100)
         self.volume_scale = ttk.Scale(self.nav_controls, from_=0, to=100, orient=tk.HORIZONTAL,
                                        variable=self.volume_var, command=self.update_volume)
         self.volume_scale.pack(side="left", padx=5)
@@ -180,6 +521,9 @@ class LockApp:
         self.timer_hitbox.bind("<Enter>", self.show_fullscreen_controls)
 
         self.position_timer_label()
+        # Layout is only recomputed when the label or the screen actually changes
+        self.timer_label.bind("<Configure>", self.position_timer_hitbox)
+        self.master.bind("<Configure>", self.on_master_configure)
 
         self.master.bind("<Key>", self.on_key_press)
         self.master.bind("<F1>", self.toggle_screensaver)
@@ -203,22 +547,30 @@ class LockApp:
                 "bottom_right": {"anchor": "se", "padx": 10, "pady": 10},
             }.get(self.timer_position, {"anchor": "ne", "padx": 10, "pady": 10})
 
-            screen_width = self.master.winfo_screenwidth()
-            screen_height = self.master.winfo_screenheight()
+            screen_width, screen_height = self.screen_size()
+            self.timer_screen_size = (screen_width, screen_height)
 
             relx = position_config["padx"] / screen_width if "left" in self.timer_position else 1 - (position_config["padx"] / screen_width)
             rely = position_config["pady"] / screen_height if "top" in self.timer_position else 1 - (position_config["pady"] / screen_height)
 
             self.timer_label.place(relx=relx, rely=rely, anchor=position_config["anchor"])
             self.timer_label.lift()
-
-            # Position the transparent hitbox around the timer
-            timer_x = self.timer_label.winfo_rootx() - 10  # Add some padding
-            timer_y = self.timer_label.winfo_rooty() - 10
-            timer_width = self.timer_label.winfo_width() + 20
-            timer_height = self.timer_label.winfo_height() + 20
-            self.timer_hitbox.place(x=timer_x, y=timer_y, width=timer_width, height=timer_height)
-            self.timer_hitbox.lift(self.timer_label) # Ensure hitbox is above the video
+            self.position_timer_hitbox()
+
+    def position_timer_hitbox(self, event=None):
+        # Position the transparent hitbox around the timer
+        timer_x = self.timer_label.winfo_x() - 10  # Add some padding
+        timer_y = self.timer_label.winfo_y() - 10
+        timer_width = self.timer_label.winfo_width() + 20
+        timer_height = self.timer_label.winfo_height() + 20
+        self.timer_hitbox.place(x=timer_x, y=timer_y, width=timer_width, height=timer_height)
+        self.timer_hitbox.lift(self.timer_label) # Ensure hitbox is above the video
+
+    def on_master_configure(self, event):
+        if event.widget is self.master:
+            self.refresh_screen_size()
+            if self.screen_size() != self.timer_screen_size:
+                self.position_timer_label()
 
     def on_controls_enter(self, event=None):
         if self.mode == "fullscreen":
@@ -244,162 +596,373 @@ class LockApp:
 
     def load_videos(self):
         if not os.path.exists(self.video_folder):
-            log_message(f"Video folder '{self.video_folder}' does not exist.", level=logging.ERROR)
-            messagebox.showerror("Error", f"Video folder '{self.video_folder}' does not exist.")
+            log_message("Video folder '%s' does not exist.", self.video_folder, level=logging.ERROR)
+            messagebox.showerror("Error", f"Video folder '{self.video_folder}' does not exist.", parent=self.master)
             return
 
-        self.current_videos = [
-            os.path.join(self.video_folder, f)
-            for f in os.listdir(self.video_folder)
-            if f.endswith(('.mp4', '.avi', '.mkv'))
-        ]
-        if not self.current_videos:
-            log_message(f"No videos found in '{self.video_folder}'.", level=logging.WARNING)
-            messagebox.showerror("Error", "No videos found in the videos folder.")
+        # Scan off the UI thread; playback starts as soon as the first batch arrives
+        self.video_scanner = VideoScanner(self.video_folder, VIDEO_MANIFEST_FILE, self.video_extensions)
+        self.video_scanner.start()
+
+    def poll_video_scanner(self):
+        if self.video_scanner and not self.closed and not self.drain_video_scanner():
+            self.master.after(50, self.poll_video_scanner)
+
+    def drain_video_scanner(self):
+        """Handle the scan results so far. Returns True once the scan is complete."""
+        while True:
+            try:
+                kind, payload = self.video_scanner.results.get_nowait()
+            except queue.Empty:
+                return False
+            if kind == "batch":
+                self.on_videos_found(payload)
+            elif kind == "done":
+                self.video_scanner = None
+                if not self.current_videos:
+                    log_message("No videos found in '%s'.", self.video_folder, level=logging.WARNING)
+                    messagebox.showerror("Error", "No videos found in the videos folder.", parent=self.master)
+                return True
+
+    def on_videos_found(self, videos):
+        first_batch = not self.current_videos
+        self.current_videos.extend(videos)
+        self.video_bag.add(videos)
+        self.media_index.add_paths(videos)
+        if first_batch:
+            self.start_video_playback()
+            if self.mode == "windowed" and self.popups and self.popup_job is None and not self.replay:
+                self.schedule_video_popup()
+
+    def video_weight(self, video):
+        return self.video_weights.get(os.path.basename(video), 1)
 
     def load_popups(self):
         try:
             with open(self.popup_text_file, 'r') as file:
                 self.popups = [line.strip() for line in file]
+            self.text_bag = ShuffleBag(self.popups, rng=self.text_rng)
         except Exception as e:
-            log_message(f"Error loading popup text file: {e}", level=logging.ERROR)
+            log_message("Error loading popup text file: %s", e, level=logging.ERROR)
 
     def schedule_popups(self):
+        if self.replay:
+            return  # The replay shows the recorded pop-ups instead
         if self.mode == "windowed" and self.popups:
             self.schedule_text_popup()
-            self.schedule_video_popup()
+            if self.current_videos:
+                self.schedule_video_popup()
 
     def schedule_text_popup(self):
         if self.mode == "windowed" and self.popups:
             self.show_text_popup()
-            self.text_popup_job = self.master.after(random.randint(100, 500), self.schedule_text_popup)
+            self.text_popup_job = self.master.after(self.text_rng.randint(100, 500), self.schedule_text_popup)
 
     def schedule_video_popup(self):
         if self.mode == "windowed" and self.current_videos:
-            self.show_video_popup()
-            self.popup_job = self.master.after(int(self.popup_interval * 1000), self.schedule_video_popup)
-
-    def show_text_popup(self):
-        if self.mode == "windowed" and self.popups:
-            popup_text = random.choice(self.popups)
-            all_fonts = font.families()
-            random_font_family = random.choice(all_fonts)
-            popup_font = font.Font(family=random_font_family, size=random.randint(30, 60), weight="bold")
-            r, g, b = [random.randint(50, 200) for _ in range(3)]
-            desaturated_color = '#%02x%02x%02x' % (r, g, b)
-
-            text_popup = tk.Toplevel(self.master, bg=self.bg_color if self.show_popup_bg else '')
-            text_popup.overrideredirect(True)
-            text_popup.attributes('-topmost', True)
-
-            screen_width = self.master.winfo_screenwidth()
-            screen_height = self.master.winfo_screenheight()
-            text_label = ttk.Label(text_popup, text=popup_text, font=popup_font, foreground=desaturated_color, background=self.bg_color if self.show_popup_bg else '')
-            text_label.pack(expand=True, fill='both')
-
-            text_popup_width = text_label.winfo_reqwidth()
-            text_popup_height = text_label.winfo_reqheight()
-            x = random.randint(0, screen_width - text_popup_width)
-            y = random.randint(0, screen_height - text_popup_height)
-            text_popup.geometry(f"{text_popup_width}x{text_popup_height}+{x}+{y}")
+            live_windows = [w for w in self.popup_windows if getattr(w, 'media', None)]
+            self.popup_admission.observe_tick()
+            self.popup_admission.observe_frames(live_windows)
+            self.popup_admission.adjust()
+            if self.popup_admission.admit(len(live_windows)):
+                self.show_video_popup()
+            self.popup_job = self.master.after(self.popup_admission.next_delay(self.popup_interval), self.schedule_video_popup)
+
+    def replay_record(self, kind, data):
+        if kind == "video_popup":
+            self.show_video_popup(plan=data)
+        elif kind == "text_popup":
+            self.show_text_popup(plan=data)
+        elif kind == "config":
+            self.apply_config_changes(data["changes"])
+
+    def show_text_popup(self, plan=None):
+        if self.mode == "windowed" and (self.popups or plan):
+            render_start = time.perf_counter()
+            if plan:
+                popup_text, random_font_family, font_size = plan["text"], plan["font"], plan["size"]
+                desaturated_color = plan["color"]
+            else:
+                popup_text = self.text_bag.draw()
+                random_font_family = self.text_rng.choice(self.font_cache.families)
+                font_size = self.text_rng.randint(30, 60)
+                r, g, b = [self.text_rng.randint(50, 200) for _ in range(3)]
+                desaturated_color = '#%02x%02x%02x' % (r, g, b)
+            popup_font = self.font_cache.get_font(random_font_family, font_size)
+
+            text_popup = self.window_pool.acquire("text", self.bg_color if self.show_popup_bg else '')
+            text_popup.text_label.config(text=popup_text, font=popup_font, foreground=desaturated_color, background=self.bg_color if self.show_popup_bg else '')
+
+            text_popup_width, text_popup_height = self.font_cache.measure(popup_text, random_font_family, font_size)
+            x, y = (plan["x"], plan["y"]) if plan else self.placer.place(text_popup_width, text_popup_height)
+            self.window_pool.show(text_popup, text_popup_width, text_popup_height, x, y)
+            self.placer.add(text_popup, x, y, text_popup_width, text_popup_height)
+            self.journal.record("text_popup", text=popup_text, font=random_font_family, size=font_size,
+                                color=desaturated_color, x=x, y=y)
 
             self.popup_windows.append(text_popup)
             self.master.after(200, lambda w=text_popup: self.hide_popup(w))
 
-    def show_video_popup(self):
-        if self.mode == "windowed" and self.current_videos:
-            popup_window = tk.Toplevel(self.master, bg=self.bg_color if self.show_popup_bg else 'black')
-            popup_window.overrideredirect(True)
-            popup_window.attributes('-topmost', True)
-
-            screen_width = self.master.winfo_screenwidth()
-            screen_height = self.master.winfo_screenheight()
-            width = int(screen_width * self.popup_video_size_percent)
-            height = int(screen_height * self.popup_video_size_percent)
-            x = random.randint(0, screen_width - width)
-            y = random.randint(0, screen_height - height)
-            popup_window.geometry(f"{width}x{height}+{x}+{y}")
-
-            popup_video_frame = tk.Frame(popup_window, bg='black')
-            popup_video_frame.pack(fill="both", expand=True)
-
-            try:
-                instance = vlc.Instance("--no-xlib", "--quiet")
-                player = instance.media_player_new()
-                video = random.choice(self.current_videos)
-                media = instance.media_new_path(video)
-                player.set_media(media)
-                player.set_hwnd(popup_video_frame.winfo_id())
-
-                # Get video duration in milliseconds
-                media.parse()
-                duration = media.get_duration()
-
-                # Loop the video
-                def video_ended(event):
-                    player.play()
-                player.event_manager().event_attach(vlc.EventType.MediaPlayerEndReached, video_ended)
-                player.play()
+            render_time = time.perf_counter() - render_start
+            self.font_cache.record_render(render_time)
+            log_message("Text pop-up rendered in %.2f ms", render_time * 1000, level=logging.DEBUG)
+            if self.font_cache.renders % TEXT_STATS_EVERY == 0:
+                self.font_cache.log_stats()
+
+    def show_video_popup(self, plan=None):
+        if self.mode == "windowed" and (self.current_videos or plan):
+            if plan:
+                video, (width, height, x, y) = plan["video"], plan["rect"]
+                with_audio, start_time = plan["audio"], plan["start"]
+            else:
+                # Same box proxy_videos.py sizes the proxies for, so lookups match
+                width, height = popup_box(*self.screen_size(), self.popup_video_size)
+                x, y = self.placer.place(width, height)
+                video = self.video_bag.draw()
+                # Only one pop-up at a time decodes audio, unless configured otherwise
+                with_audio = self.popup_audio == "all" or (self.popup_audio == "leader" and self.audio_leader is None)
+                # Duration in milliseconds from the metadata index, 0 until indexed
+                duration = self.media_index.get_duration(video)
+                start_time = 0
                 if duration > self.popup_duration * 1000:
-                    start_time = random.randint(0, int(duration - (self.popup_duration * 1000)))
-                    player.set_time(start_time)
-                popup_window.player = player
-                log_message(f"Pop-up video started: {os.path.basename(video)}{' at random time' if duration > self.popup_duration * 1000 else ''}.")
-                self.popup_windows.append(popup_window)
-                self.master.after(int(self.popup_duration * 1000), lambda w=popup_window: self.hide_popup(w))
-            except Exception as e:
-                log_message(f"Error creating pop-up video: {e}", level=logging.ERROR)
+                    start_time = self.offset_rng.randint(0, int(duration - (self.popup_duration * 1000)))
+            # A pre-generated small proxy (see proxy_videos.py) decodes much faster than the original
+            proxy = self.proxies.lookup(video, width, height)
+            options = popup_media_options(self.popup_decoder_threads, self.popup_skip_loop_filter,
+                                          self.popup_skip_frame, audio=with_audio)
+            bg = self.bg_color if self.show_popup_bg else 'black'
+
+            if self.popup_workers:
+                popup_window = self.popup_workers.show(proxy or video, (width, height, x, y), start_time, options, bg)
+                if popup_window is None:
+                    log_message("No pop-up worker process available.", level=logging.WARNING)
+                    return
+            else:
+                popup_window = self.start_local_video_popup(proxy or video, (width, height, x, y), start_time,
+                                                            options, bg)
+                if popup_window is None:
+                    return
+            self.placer.add(popup_window, x, y, width, height)
+            self.journal.record("video_popup", video=video, rect=[width, height, x, y], audio=with_audio,
+                                start=start_time, lag_ms=round(self.popup_admission.lag * 1000, 1),
+                                live=len(self.popup_windows))
+            popup_window.frame_counts = (0, 0)
+            popup_window.video = video
+            if with_audio and self.popup_audio == "leader":
+                self.audio_leader = popup_window
+            log_message("Pop-up video started: %s%s%s.", os.path.basename(video), ' (proxy)' if proxy else '',
+                        ' at random time' if start_time else '')
+            self.popup_windows.append(popup_window)
+            popup_window.hide_job = self.master.after(int(self.popup_duration * 1000),
+                                                      lambda w=popup_window: self.hide_popup(w))
+
+    def start_local_video_popup(self, path, geometry, start_time, options, bg):
+        popup_window = self.window_pool.acquire("video", bg)
+        self.window_pool.show(popup_window, *geometry)
+        player = media = events = None
+        try:
+            player = self.player_pool.acquire()
+            media = resources.track("media", self.instance.media_new_path(path))
+            apply_options(media, options)
+            player.set_media(media)
+            player.set_hwnd(popup_window.video_frame.winfo_id())
+            events = self.event_bridge.subscribe(
+                player.event_manager(),
+                {vlc.EventType.MediaPlayerEndReached: "end", vlc.EventType.MediaPlayerEncounteredError: "error"},
+                lambda kind, w=popup_window: self.on_popup_event(w, kind))
+            player.play()
+            if start_time:
+                player.set_time(start_time)
+            popup_window.events = events
+            popup_window.player = player
+            popup_window.media = media
+            return popup_window
+        except Exception as e:
+            log_message("Error creating pop-up video: %s", e, level=logging.ERROR)
+            # Undo whatever was set up, in reverse order
+            self.event_bridge.unsubscribe(events)
+            if player is not None:
+                self.player_pool.release(player)
+            if media is not None:
+                media.release()
+                resources.release("media", media)
+            self.window_pool.release(popup_window)
+            return None
+
+    def on_popup_event(self, window, kind):
+        if kind == "end":
+            window.player.play()  # Loop the video
+        elif kind == "error":
+            log_message("Pop-up video failed to play: %s", os.path.basename(window.video), level=logging.WARNING)
+            self.hide_popup(window)
+
+    def poll_popup_workers(self):
+        if self.closed:
+            return
+        # Pop-ups that failed or died with their worker free their slot, place and audio now
+        for popup in self.popup_workers.poll():
+            self.hide_popup(popup)
+        self.master.after(WORKER_POLL_MS, self.poll_popup_workers)
 
     def hide_popup(self, window):
         if window in self.popup_windows:
-            if hasattr(window, 'player'):
+            self.placer.remove(window)
+            if getattr(window, 'hide_job', None):
+                # Hidden early (e.g. after a playback error); the window may be reused before the job fires
+                self.master.after_cancel(window.hide_job)
+                window.hide_job = None
+            if getattr(window, 'media', None):
+                self.playback_stats.finish(window, window.media, window.video, "popup")
+            if window is self.audio_leader:
+                self.audio_leader = None
+            if getattr(window, 'remote', False):
+                self.popup_workers.hide(window)
+                window.media = None
+                self.popup_windows.remove(window)
+                return
+            if getattr(window, 'player', None):
                 try:
-                    window.player.stop()
-                    window.player.event_manager().event_detach(vlc.EventType.MediaPlayerEndReached)
+                    self.event_bridge.unsubscribe(window.events)
+                    self.player_pool.release(window.player)
+                    # The player kept its own reference until it was stopped
+                    window.media.release()
+                    resources.release("media", window.media)
                 except Exception as e:
-                    log_message(f"Error stopping pop-up video: {e}", level=logging.ERROR)
+                    log_message("Error stopping pop-up video: %s", e, level=logging.ERROR)
+                window.player = None
+                window.media = None
             try:
-                window.destroy()
+                self.window_pool.release(window)
             except Exception as e:
-                log_message(f"Error destroying pop-up window: {e}", level=logging.ERROR)
+                log_message("Error recycling pop-up window: %s", e, level=logging.ERROR)
             self.popup_windows.remove(window)
 
     def lock_input(self):
+        if pyautogui is None:
+            return  # Start-up failed before the heavy modules were loaded
         pyautogui.FAILSAFE = False
         pyautogui.moveTo(0, 0)
 
     def unlock_input(self):
-        pyautogui.FAILSAFE = True
+        if pyautogui is not None:
+            pyautogui.FAILSAFE = True
 
     def start_video_playback(self):
         if not self.current_videos:
             return
 
-        self.instance = vlc.Instance("--no-xlib", "--quiet")
-        self.player = self.instance.media_player_new()
+        self.player = resources.track("media_player", self.instance.media_player_new())
+        # python-vlc keeps the ctypes callbacks on the EventManager wrapper, and
+        # event_manager() returns a new wrapper each time, so this one is kept
+        self.player_event_manager = self.player.event_manager()
+        # on_first_frame only logs, which is thread-safe, so it stays a direct callback
+        self.player_event_manager.event_attach(vlc.EventType.MediaPlayerVout, self.on_first_frame)
+        self.first_frame_attached = True
+        self.player_events = self.event_bridge.subscribe(
+            self.player_event_manager, {vlc.EventType.MediaPlayerEncounteredError: "error"}, self.on_player_event)
         self.player.set_hwnd(self.video_frame.winfo_id())
-        self.play_next_video()
+        self.player.audio_set_volume(self.volume_var.get())
+        self.player.set_rate(self.playback_speed_var.get())
 
         if self.mode == "fullscreen":
             self.player.set_fullscreen(True)
-            self.master.after(1000, self.loop_videos)
+            self.start_playlist()
+        else:
+            self.play_next_video()
 
-    def loop_videos(self):
-        if self.mode == "fullscreen" and not self.player.is_playing():
+    def start_playlist(self):
+        # Two-slot looping media list: libVLC switches to the pre-opened slot by
+        # itself at end of clip, and we refill the other slot once it has.
+        self.media_list = resources.track("media_list", self.instance.media_list_new())
+        self.playlist_paths = [None, None]
+        self.set_playlist_slot(0, self.draw_main_video())
+        self.list_player = resources.track("media_list_player", self.instance.media_list_player_new())
+        self.list_player.set_media_player(self.player)
+        self.list_player.set_media_list(self.media_list)
+        self.list_player.set_playback_mode(vlc.PlaybackMode.loop)
+        self.list_player_events = self.event_bridge.subscribe(
+            self.list_player.event_manager(), {vlc.EventType.MediaListPlayerNextItemSet: "next_item_set"},
+            lambda kind: self.on_playlist_item_changed())
+        self.list_player.play()
+
+    def set_playlist_slot(self, index, video):
+        media = self.instance.media_new(video)
+        # Pre-parse asynchronously so the demuxer has what it needs at switch time
+        media.parse_with_options(vlc.MediaParseFlag.local, -1)
+        self.media_list.lock()
+        try:
+            if index < self.media_list.count():
+                self.media_list.remove_index(index)
+            self.media_list.insert_media(media, index)
+        finally:
+            self.media_list.unlock()
+        media.release()  # The media list holds its own reference
+        self.playlist_paths[index] = video
+
+    def on_player_event(self, kind):
+        if kind == "error":
+            log_message("Video failed to play, skipping it.", level=logging.WARNING)
             self.play_next_video()
-        if self.mode == "fullscreen":
-            self.master.after(1000, self.loop_videos)
+
+    def on_playlist_item_changed(self):
+        current = self.player.get_media()
+        if current is None:
+            return
+        try:
+            index = self.playlist_index(current)
+        finally:
+            current.release()
+        if index < 0:
+            return
+        video = self.playlist_paths[index]
+        duration = self.media_index.get_duration(video)
+        log_message("Now playing: %s%s", os.path.basename(video), f" ({duration // 1000}s)" if duration else '')
+        # The other slot holds the clip that just finished; count its last frames before replacing it
+        self.media_list.lock()
+        try:
+            previous = self.media_list.item_at_index(1 - index)
+        finally:
+            self.media_list.unlock()
+        if previous is not None:
+            finished = self.playlist_paths[1 - index]
+            self.playback_stats.finish(("main", finished), previous, finished, self.mode)
+            previous.release()
+        self.set_playlist_slot(1 - index, self.draw_main_video())
 
     def play_next_video(self):
-        if self.current_videos:
-            video = random.choice(self.current_videos)
+        if self.list_player:
+            self.list_player.next()
+        elif self.player and self.current_videos:
+            video = self.draw_main_video()
+            if self.now_playing:
+                self.finish_main_stats()
             media = self.instance.media_new(video)
             self.player.set_media(media)
+            media.release()
             self.player.play()
-            log_message(f"Now playing: {os.path.basename(video)}")
+            self.now_playing = video
+            duration = self.media_index.get_duration(video)
+            log_message("Now playing: %s%s", os.path.basename(video), f" ({duration // 1000}s)" if duration else '')
         else:
             log_message("No videos available to play.", level=logging.WARNING)
 
+    def draw_main_video(self):
+        # A replay plays the recorded videos in order, then carries on with the shuffle bag
+        video = self.replay.next_main_video() if self.replay else None
+        if video is None:
+            video = self.video_bag.draw()
+        self.journal.record("main_video", video=video)
+        return video
+
+    def finish_main_stats(self):
+        media = self.player.get_media()
+        if media is not None:
+            try:
+                video = self.main_video_path(media)
+                self.playback_stats.finish(("main", video), media, video, self.mode)
+            finally:
+                media.release()
+
     def update_playback_speed(self, speed):
         if self.player:
             self.player.set_rate(float(speed))
@@ -409,44 +972,69 @@ class LockApp:
             self.player.audio_set_volume(int(volume))
 
     def start_timer(self):
+        # The countdown follows a monotonic deadline, so late or skipped ticks
+        # never stretch the lock beyond the configured duration
         self.timer_running = True
+        self.timer_deadline = time.monotonic() + self.timer_duration
         self.time_left = self.timer_duration
         self.update_timer_display()
-        self.master.after(1000, self.update_timer)
+        self.schedule_timer_tick()
+
+    def schedule_timer_tick(self):
+        now = time.monotonic()
+        remaining = self.timer_deadline - now
+        # Wake just after the displayed value next changes
+        delay = remaining - math.floor(remaining)
+        self.timer_next_tick = now + delay
+        self.master.after(int(delay * 1000) + 1, self.update_timer)
 
     def update_timer(self):
         if self.timer_running:
-            self.time_left -= 1
+            now = time.monotonic()
+            self.timer_max_lateness = max(self.timer_max_lateness, now - self.timer_next_tick)
+            remaining = self.timer_deadline - now
+            self.time_left = max(0, math.ceil(remaining))
             self.update_timer_display()
-            if self.time_left <= 0:
+            if remaining <= 0:
+                self.timer_running = False
+                self.timer_overrun = -remaining
                 log_message("Timer ended.")
                 self.unlock_input()
-                self.master.quit()
+                self.request_exit()
             else:
-                self.master.after(1000, self.update_timer)
+                self.schedule_timer_tick()
 
     def update_timer_display(self):
         if self.timer_label:
             minutes, seconds = divmod(self.time_left, 60)
             self.timer_label.config(text=f"{minutes:02}:{seconds:02}")
-            self.position_timer_label()
+
+    def log_timer_drift(self):
+        if self.timer_deadline is None:
+            return
+        if self.timer_overrun is not None:
+            log_message("Countdown ended %.0f ms after its deadline (worst tick %.0f ms late).",
+                        self.timer_overrun * 1000, self.timer_max_lateness * 1000)
+        else:
+            log_message("Countdown stopped with %.1f s left (worst tick %.0f ms late).",
+                        self.timer_deadline - time.monotonic(), self.timer_max_lateness * 1000)
 
     def verify_password(self):
         if self.password_entry.get() == self.correct_password:
             log_message("Correct password entered.")
             self.unlock_input()
-            self.master.quit()
+            self.request_exit()
         else:
             log_message("Incorrect password attempt.", level=logging.WARNING)
-            messagebox.showerror("Incorrect Password", "The password you entered is incorrect.")
+            messagebox.showerror("Incorrect Password", "The password you entered is incorrect.", parent=self.master)
             self.password_entry.delete(0, tk.END)
 
     def on_key_press(self, event):
-        log_message(f"Key pressed: {event.keysym}, Keycode: {event.keycode}", level=logging.DEBUG)
+        log_message("Key pressed: %s, Keycode: %s", event.keysym, event.keycode, level=logging.DEBUG)
         if event.keysym == "Escape":
             log_message("Escape key pressed.")
             self.unlock_input()
-            self.master.quit()
+            self.request_exit()
         elif self.show_password and event.widget != self.password_entry:
             return "break"
         elif not self.show_password:
@@ -461,7 +1049,7 @@ class LockApp:
     def toggle_screensaver(self, event=None):
         if self.mode == "windowed":
             return  # Disable screensaver in popup mode
-        log_message(f"Toggle Screensaver called. Current state: {'Active' if self.is_screensaver_active else 'Inactive'}", level=logging.DEBUG)
+        log_message("Toggle Screensaver called. Current state: %s", 'Active' if self.is_screensaver_active else 'Inactive', level=logging.DEBUG)
         if self.player:
             if self.is_screensaver_active:
                 self.hide_screensaver()
@@ -479,22 +1067,24 @@ class LockApp:
                     self._playback_before_screensaver = False
                 if self.screensaver_image_path:
                     try:
-                        self.screensaver_image = ImageTk.PhotoImage(Image.open(self.screensaver_image_path))
-                        self.screensaver_label = tk.Label(self.master, image=self.screensaver_image, bg='black')
+                        self.screensaver_image = self.screensaver_cache.get(self.screensaver_image_path, self.screen_size())
+                        if self.screensaver_label is None:
+                            self.screensaver_label = tk.Label(self.master, bg='black')
+                        self.screensaver_label.config(image=self.screensaver_image)
                         self.screensaver_label.place(relx=0.5, rely=0.5, anchor="center")
+                        self.screensaver_label.lift()
                         for popup in self.popup_windows:
                             if isinstance(popup, tk.Toplevel) and popup.winfo_exists():
                                 popup.withdraw()
                         self.is_screensaver_active = True
                         log_message("Screensaver activated.")
                     except Exception as e:
-                        log_message(f"Error loading screensaver image: {e}", level=logging.ERROR)
+                        log_message("Error loading screensaver image: %s", e, level=logging.ERROR)
 
     def hide_screensaver(self, event=None):
         log_message("Hide Screensaver called.", level=logging.DEBUG)
-        if self.screensaver_label:
+        if self.screensaver_label and self.screensaver_label.winfo_manager():
             self.screensaver_label.place_forget()
-            self.screensaver_label = None
             for popup in self.popup_windows:
                 if isinstance(popup, tk.Toplevel) and popup.winfo_exists():
                     popup.deiconify()
@@ -509,20 +1099,91 @@ class LockApp:
                     self.player.set_fullscreen(True)  # Reapply video fullscreen
             self.show_fullscreen_controls()
 
+    def shutdown(self):
+        self.closed = True
+        self.timer_running = False
+        for job in (self.popup_job, self.text_popup_job):
+            if job is not None:
+                self.master.after_cancel(job)
+        self.popup_job = self.text_popup_job = None
+        if self.video_scanner:
+            self.video_scanner.stop()
+            self.video_scanner = None
+        self.log_timer_drift()
+        for window in list(self.popup_windows):
+            self.hide_popup(window)
+        if self.player:
+            self.finish_main_stats()
+        self.playback_stats.log_summary()
+        if self.player_pool:
+            self.player_pool.log_stats()
+            self.player_pool.close()
+        if self.popup_workers:
+            self.popup_workers.log_stats()
+            self.popup_workers.close()
+        if self.mode == "windowed":
+            self.popup_admission.log_stats()
+        if self.font_cache:
+            self.font_cache.log_stats()
+        if self.proxies:
+            self.proxies.log_stats()
+        if self.placer:
+            self.placer.log_stats()
+        if self.window_pool:
+            self.window_pool.log_stats()
+            self.window_pool.close()
+        self.event_bridge.unsubscribe(self.list_player_events)
+        self.event_bridge.unsubscribe(self.player_events)
+        self.detach_first_frame()
+        self.event_bridge.stop()
+        self.event_bridge.log_stats()
+        if self.list_player:
+            self.list_player.stop()
+            self.list_player.release()
+            resources.release("media_list_player", self.list_player)
+            self.list_player = None
+            self.media_list.release()
+            resources.release("media_list", self.media_list)
+            self.media_list = None
+        if self.player:
+            self.player.stop()
+            self.player.release()
+            resources.release("media_player", self.player)
+            self.player = None
+        self.media_index.stop()
+        self.recent_videos.save(PLAY_HISTORY_FILE)
+        if self.replay:
+            self.replay.stop()
+        self.journal.record("end")
+        self.journal.close()
+        if self.instance:
+            self.instance.release()
+            resources.release("vlc_instance", self.instance)
+            self.instance = None
+        log_message("Resources at exit: %s", resources.describe())
+
 def main():
+    parser = argparse.ArgumentParser(description="Lockdown video player.")
+    parser.add_argument("--replay", metavar="JOURNAL", help="re-run a session recorded in the journals folder")
+    args = parser.parse_args()
+
+    setup_logging()
+    start_heavy_imports()
     config = load_config()
+    replay = None
+    if args.replay:
+        replay = SessionReplay(args.replay)
+        config.update({key: value for key, value in replay.config.items() if key in config})
+    set_log_level(config["log_level"])
 
-    answer = messagebox.askyesno(
-        "Warning",
-        "This program will play videos continuously until you type the correct password, press the ESC key, or the timer runs out. Do you want to continue?"
-    )
-    if not answer:
+    if not confirm_start():
         log_message("User chose not to continue.")
         return
 
     root = tk.Tk()
-    app = LockApp(root, config)
+    app = LockApp(root, config, replay=replay)
     root.mainloop()
+    app.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,173 @@
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILE = "config.txt"
+DEFAULT_PASSWORD = "password"
+
+
+def _hex_color(value):
+    return re.match(r'^#([0-9a-fA-F]{3}){1,2}$', value) is not None
+
+
+def _one_of(*choices):
+    return lambda value: value in choices
+
+
+def _between(low, high):
+    return lambda value: low <= value <= high
+
+
+# key: (type, default, validator)
+SCHEMA = {
+    "password": (str, DEFAULT_PASSWORD, None),
+    "log_level": (str, "INFO", _one_of("INFO", "DEBUG", "WARNING", "ERROR")),
+    "timer": (int, 0, _between(0, 10 ** 7)),
+    "timer_position": (str, "top_right", _one_of("top_left", "top_right", "bottom_left", "bottom_right")),
+    "theme": (str, "Light", _one_of("Light", "Dark")),
+    "mode": (str, "fullscreen", _one_of("fullscreen", "windowed")),
+    "bg_color": (str, "#000000", _hex_color),
+    "screensaver_image_path": (str, "", None),
+    "popup_text_file": (str, "", None),
+    "popup_interval": (float, 0.5, _between(0.05, 3600)),
+    "popup_duration": (float, 5.0, _between(0.1, 3600)),
+    "popup_video_size": (int, 5, _between(1, 10)),
+    "show_skip_button": (bool, True, None),
+    "show_password": (bool, True, None),
+    "show_popup_bg": (bool, True, None),
+    "use_default_videos": (bool, True, None),
+    "video_extensions": (str, ".mp4,.avi,.mkv,.mov", None),
+    "video_weights_file": (str, "", None),
+    "no_repeat_window": (int, 10, _between(0, 1000)),
+    "player_pool_size": (int, 4, _between(0, 64)),
+    "popup_window_pool_size": (int, 8, _between(0, 64)),
+    "max_popup_players": (int, 6, _between(1, 100)),
+    "adaptive_popups": (bool, True, None),
+    "volume": (int, 100, _between(0, 100)),
+    "playback_speed": (float, 1.0, _between(0.5, 2.0)),
+    "popup_audio": (str, "leader", _one_of("all", "leader", "off")),
+    "popup_decoder_threads": (int, 1, _between(0, 16)),
+    "popup_skip_loop_filter": (int, 4, _between(0, 4)),
+    "popup_skip_frame": (int, 0, _between(-1, 3)),
+    "popup_worker_processes": (int, 0, _between(0, 16)),
+    "popup_overlap_tolerance": (float, 0.1, _between(0.0, 1.0)),
+    "session_seed": (int, 0, _between(0, 2 ** 31 - 1)),
+    "cleanup_growth_mb": (int, 256, _between(0, 65536)),
+}
+
+_cache = {}  # path -> (mtime_ns, values)
+
+
+def default_config():
+    return {key: default for key, (_, default, _) in SCHEMA.items()}
+
+
+def parse_value(key, text):
+    value_type, default, validator = SCHEMA[key]
+    text = text.strip()
+    if value_type is bool:
+        value = text == "True"
+    elif value_type is str:
+        value = text
+    elif text == "":
+        value = default
+    else:
+        value = value_type(text)
+    if validator and not validator(value):
+        raise ValueError(f"{text!r} is out of range")
+    return value
+
+
+def format_value(key, value):
+    if key == "timer" and not value:
+        return ""  # An empty timer means no countdown
+    return str(value)
+
+
+def read_config(path=CONFIG_FILE):
+    """Parse, type-convert and validate a config file. Invalid values fall back to defaults."""
+    config = default_config()
+    try:
+        with open(path, 'r') as config_file:
+            lines = config_file.readlines()
+    except OSError as e:
+        logger.error("Error loading configuration file: %s", e)
+        return config
+    for line in lines:
+        if '=' not in line:
+            continue
+        key, text = line.rstrip('\n').split('=', 1)
+        key = key.strip()
+        if key not in SCHEMA:
+            config[key] = text  # Unknown keys are kept as-is
+            continue
+        try:
+            config[key] = parse_value(key, text)
+        except ValueError as e:
+            logger.warning("Invalid value for %s in %s (%s); using default %r", key, path, e, SCHEMA[key][1])
+    return config
+
+
+def load_config(path=CONFIG_FILE):
+    """Typed configuration, re-read only when the file's mtime changes."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return default_config()
+    cached = _cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read_config(path))
+        _cache[path] = cached
+        logger.info("Loaded configuration: %s", cached[1])
+    return dict(cached[1])
+
+
+def save_config(config, path=CONFIG_FILE):
+    """Write the configuration atomically. Raises OSError on failure."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as config_file:
+        for key, value in config.items():
+            config_file.write(f"{key}={format_value(key, value)}\n")
+    os.replace(tmp_path, path)
+    _cache.pop(path, None)
+
+
+def save_json(data, path, description, **dump_options):
+    """Write data as JSON atomically. Errors are logged, not raised; returns True on success."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w') as json_file:
+            json.dump(data, json_file, **dump_options)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        logger.error("Error saving %s: %s", description, e)
+        return False
+
+
+class ConfigWatcher:
+    """Polls the config file's mtime and reports which keys changed."""
+
+    def __init__(self, path=CONFIG_FILE, values=None):
+        self.path = path
+        self.mtime = self._mtime()
+        self.values = values if values is not None else load_config(path)
+
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self):
+        mtime = self._mtime()
+        if mtime == self.mtime:
+            return {}
+        self.mtime = mtime
+        values = load_config(self.path)
+        changed = {key: value for key, value in values.items() if self.values.get(key) != value}
+        self.values = values
+        return changed
@@ -0,0 +1,47 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+LOG_FILE = "Log.txt"
+LOG_MAX_BYTES = 2 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_listener = None
+
+
+def setup_logging(level="INFO", log_file=LOG_FILE):
+    """Route all logging through a queue to a rotating file written on a background thread."""
+    global _listener
+    if _listener is None:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        log_queue = queue.SimpleQueue()
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, file_handler)
+        _listener.start()
+        atexit.register(stop_logging)
+    set_log_level(level)
+
+
+def set_log_level(level):
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.getLogger().setLevel(level)
+
+
+def stop_logging():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def log_message(message, *args, level=logging.INFO):
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    logging.log(level, message, *args)
@@ -0,0 +1,369 @@
+"""Headless benchmarks for LockApp.
+
+Drives LockApp in-process on an X display (Xvfb is started with --xvfb) using
+either python-vlc or the stub in stub_vlc.py (--stub-vlc), and writes the
+results as JSON so runs can be compared over time:
+
+    python benchmarks/bench_lockapp.py --xvfb --stub-vlc
+    python benchmarks/bench_lockapp.py --xvfb --scenarios loop_lag countdown_drift
+
+Scenarios:
+    spawn_latency    time spent in show_video_popup / show_text_popup
+    memory           RSS over a simulated hour of pop-ups
+    loop_lag         lateness of a Tk after() probe while pop-ups run
+    countdown_drift  how late the countdown ends under pop-up load
+    clip_switch      fullscreen gap between end of clip and next first frame
+"""
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+WORDS_FILE = os.path.join(REPO_DIR, "Words.txt")
+PROBE_MS = 20
+TEXT_INTERVAL = 0.3  # Mean gap between text pop-ups (randint(100, 500) ms)
+LIVE_TEXT_POPUPS = 2  # Text pop-ups live for 200 ms, so about this many overlap
+
+# Imported by load_app() once vlc has been chosen
+tk = None
+vlc = None
+LockTestpy = None
+app_config = None
+
+
+def load_app(use_stub, workdir, videos=None):
+    global tk, vlc, LockTestpy, app_config
+    sys.path.insert(0, REPO_DIR)
+    if use_stub:
+        sys.path.insert(0, BENCH_DIR)
+        sys.modules["vlc"] = importlib.import_module("stub_vlc")
+    # Input locking is not measured, and pyautogui wants a full desktop session
+    pyautogui = types.ModuleType("pyautogui")
+    pyautogui.FAILSAFE = True
+    pyautogui.moveTo = lambda *args, **kwargs: None
+    sys.modules["pyautogui"] = pyautogui
+
+    import tkinter
+    tk = tkinter
+    vlc = importlib.import_module("vlc")
+    app_config = importlib.import_module("app_config")
+    LockTestpy = importlib.import_module("LockTestpy")
+    # Keep runtime caches, history and the log out of the checkout
+    for name in ("MEDIA_INDEX_FILE", "VIDEO_MANIFEST_FILE", "PLAY_HISTORY_FILE", "PLAYBACK_METRICS_FILE", "JOURNAL_DIR"):
+        setattr(LockTestpy, name, os.path.join(workdir, os.path.basename(getattr(LockTestpy, name))))
+    if videos:
+        LockTestpy.DEFAULT_VIDEO_FOLDER = os.path.abspath(videos)
+    os.chdir(workdir)
+    LockTestpy.setup_logging(log_file=os.path.join(workdir, "Log.txt"))
+
+
+def start_xvfb(display_num):
+    process = subprocess.Popen(["Xvfb", f":{display_num}", "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    socket_path = f"/tmp/.X11-unix/X{display_num}"
+    deadline = time.monotonic() + 10
+    while not os.path.exists(socket_path):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError(f"Xvfb did not start on :{display_num}")
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = f":{display_num}"
+    return process
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm", 'r') as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def percentiles(seconds):
+    values = sorted(value * 1000 for value in seconds)
+    if not values:
+        return {"count": 0}
+
+    def rank(p):
+        return round(values[min(len(values) - 1, int(p / 100 * len(values)))], 3)
+    return {"count": len(values), "mean": round(sum(values) / len(values), 3),
+            "p50": rank(50), "p90": rank(90), "p99": rank(99), "max": round(values[-1], 3)}
+
+
+def make_app(**overrides):
+    config = app_config.default_config()
+    # The Light theme uses ttk's "vista" theme, which only exists on Windows
+    config.update(theme="Dark", log_level="INFO")
+    config.update(overrides)
+    root = tk.Tk()
+    app = LockTestpy.LockApp(root, config)
+    return root, app
+
+
+def close_app(root, app):
+    app.shutdown()
+    root.destroy()
+    gc.collect()
+
+
+def pump(root, predicate, timeout):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        root.update()
+        time.sleep(0.005)
+    return True
+
+
+def run_loop(root, seconds):
+    job = root.after(int(seconds * 1000), root.quit)
+    start = time.monotonic()
+    root.mainloop()
+    root.after_cancel(job)
+    return time.monotonic() - start
+
+
+def wait_for_videos(root, app):
+    if not pump(root, lambda: app.current_videos, 30):
+        raise RuntimeError(f"No videos found in {app.video_folder}")
+
+
+def enable_text_popups(app):
+    # Text pop-ups are driven by hand; loading them before the first video batch would start the schedulers
+    with open(WORDS_FILE, 'r') as words:
+        app.popups = [line.strip() for line in words]
+    app.text_bag = LockTestpy.ShuffleBag(app.popups)
+
+
+def trim_popups(app, max_video, max_text=LIVE_TEXT_POPUPS):
+    video = [w for w in app.popup_windows if getattr(w, 'media', None)]
+    text = [w for w in app.popup_windows if w.kind == "text"]
+    for window in video[:max(0, len(video) - max_video)] + text[:max(0, len(text) - max_text)]:
+        app.hide_popup(window)
+
+
+def bench_spawn_latency(args):
+    # popup_duration is long so that only trim_popups() hides video pop-ups
+    root, app = make_app(mode="windowed", popup_duration=3600)
+    try:
+        wait_for_videos(root, app)
+        enable_text_popups(app)
+        video, text = [], []
+        for _ in range(args.spawns):
+            start = time.perf_counter()
+            app.show_video_popup()
+            video.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            app.show_text_popup()
+            text.append(time.perf_counter() - start)
+            trim_popups(app, app.max_popup_players)
+            root.update()
+        return {"spawns": args.spawns, "video_popup_ms": percentiles(video), "text_popup_ms": percentiles(text)}
+    finally:
+        close_app(root, app)
+
+
+def bench_memory(args):
+    root, app = make_app(mode="windowed", popup_duration=3600)
+    try:
+        wait_for_videos(root, app)
+        enable_text_popups(app)
+        interval = app.popup_interval
+        spawns = int(args.simulated_seconds / interval)
+        sample_every = max(1, spawns // 60)
+        samples = []
+        text_credit = 0.0
+        text_popups = 0
+        rss_start = rss_kb()
+        start = time.monotonic()
+        for index in range(spawns):
+            if index == args.warmup:
+                gc.collect()
+                rss_start = rss_kb()
+            if index >= args.warmup and (index - args.warmup) % sample_every == 0:
+                samples.append({"simulated_s": round(index * interval, 1), "rss_kb": rss_kb()})
+            app.show_video_popup()
+            text_credit += interval / TEXT_INTERVAL
+            while text_credit >= 1:
+                text_credit -= 1
+                app.show_text_popup()
+                text_popups += 1
+            trim_popups(app, app.max_popup_players)
+            root.update()
+        trim_popups(app, 0, 0)
+        root.update()
+        gc.collect()
+        rss_end = rss_kb()
+        samples.append({"simulated_s": round(spawns * interval, 1), "rss_kb": rss_end})
+        return {"simulated_seconds": args.simulated_seconds, "wall_seconds": round(time.monotonic() - start, 1),
+                "video_popups": spawns, "text_popups": text_popups,
+                "rss_start_kb": rss_start, "rss_end_kb": rss_end, "rss_growth_kb": rss_end - rss_start,
+                "rss_peak_kb": max(sample["rss_kb"] for sample in samples), "samples": samples}
+    finally:
+        close_app(root, app)
+
+
+def attach_lag_probe(root, app):
+    probe = {"lags": [], "live_peak": 0}
+
+    def tick(expected):
+        now = time.monotonic()
+        probe["lags"].append(max(0.0, now - expected))
+        probe["live_peak"] = max(probe["live_peak"], len(app.popup_windows))
+        root.after(PROBE_MS, tick, now + PROBE_MS / 1000)
+    root.after(PROBE_MS, tick, time.monotonic() + PROBE_MS / 1000)
+    return probe
+
+
+def bench_loop_lag(args):
+    root, app = make_app(mode="windowed", popup_text_file=WORDS_FILE)
+    try:
+        probe = attach_lag_probe(root, app)
+        run_loop(root, args.lag_seconds)
+        admission = app.popup_admission
+        return {"seconds": args.lag_seconds, "probe_ms": PROBE_MS, "lag_ms": percentiles(probe["lags"]),
+                "live_popups_peak": probe["live_peak"], "admitted": admission.admitted,
+                "deferred": admission.deferred, "final_rate_factor": round(1 / admission.factor, 3)}
+    finally:
+        close_app(root, app)
+
+
+def bench_countdown_drift(args):
+    root, app = make_app(mode="windowed", popup_text_file=WORDS_FILE, timer=args.timer_seconds)
+    try:
+        probe = attach_lag_probe(root, app)
+        elapsed = run_loop(root, args.timer_seconds + 30)
+        ended = app.timer_overrun is not None
+        return {"timer_seconds": args.timer_seconds, "ended": ended,
+                "overrun_ms": round(app.timer_overrun * 1000, 3) if ended else None,
+                "worst_tick_late_ms": round(app.timer_max_lateness * 1000, 3),
+                "loop_seconds": round(elapsed, 3), "lag_ms": percentiles(probe["lags"])}
+    finally:
+        close_app(root, app)
+
+
+def bench_clip_switch(args):
+    if args.stub_vlc:
+        vlc.CLIP_MS = args.clip_ms
+    root, app = make_app(mode="fullscreen")
+    try:
+        if not pump(root, lambda: app.player is not None, 30):
+            raise RuntimeError("Fullscreen playback did not start")
+        state = {"ended_at": None}
+        gaps = []
+
+        def on_end(event):
+            state["ended_at"] = time.monotonic()
+
+        def on_first_frame(event):
+            if state["ended_at"] is not None:
+                gaps.append(time.monotonic() - state["ended_at"])
+                state["ended_at"] = None
+        events = app.player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerEndReached, on_end)
+        events.event_attach(vlc.EventType.MediaPlayerVout, on_first_frame)
+        run_loop(root, args.switch_seconds)
+        return {"seconds": args.switch_seconds, "clip_ms": args.clip_ms if args.stub_vlc else None,
+                "switches": len(gaps), "gap_ms": percentiles(gaps)}
+    finally:
+        close_app(root, app)
+        if args.stub_vlc:
+            vlc.CLIP_MS = None
+
+
+SCENARIOS = {
+    "spawn_latency": bench_spawn_latency,
+    "memory": bench_memory,
+    "loop_lag": bench_loop_lag,
+    "countdown_drift": bench_countdown_drift,
+    "clip_switch": bench_clip_switch,
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summary_line(name, result):
+    if result.get("overrun_ms") is not None:
+        return f"{name}: ended {result['overrun_ms']} ms late, worst tick {result['worst_tick_late_ms']} ms late"
+    for key in ("video_popup_ms", "lag_ms", "gap_ms"):
+        if key in result and result[key].get("count"):
+            stats = result[key]
+            return f"{name}: {key} p50 {stats['p50']} p99 {stats['p99']} max {stats['max']}"
+    if "rss_growth_kb" in result:
+        return f"{name}: RSS {result['rss_start_kb']} -> {result['rss_end_kb']} kB ({result['rss_growth_kb']:+d})"
+    return f"{name}: {result}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless LockApp benchmarks")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--stub-vlc", action="store_true", help="use stub_vlc.py instead of python-vlc")
+    parser.add_argument("--xvfb", action="store_true", help="start a private Xvfb server")
+    parser.add_argument("--display-num", type=int, default=99)
+    parser.add_argument("--videos", help="video folder (default: the app's videos/ folder)")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--spawns", type=int, default=300)
+    parser.add_argument("--simulated-seconds", type=int, default=3600)
+    parser.add_argument("--warmup", type=int, default=50, help="pop-ups before the RSS baseline")
+    parser.add_argument("--lag-seconds", type=float, default=30)
+    parser.add_argument("--timer-seconds", type=int, default=15)
+    parser.add_argument("--switch-seconds", type=float, default=30)
+    parser.add_argument("--clip-ms", type=int, default=2000, help="stub clip length for clip_switch")
+    args = parser.parse_args()
+
+    started = datetime.now()
+    output = os.path.abspath(args.output or os.path.join(
+        RESULTS_DIR, f"bench-{started.strftime('%Y%m%d-%H%M%S')}.json"))
+    xvfb = start_xvfb(args.display_num) if args.xvfb else None
+    try:
+        if not os.environ.get("DISPLAY"):
+            parser.error("no X display: pass --xvfb or set DISPLAY")
+        with tempfile.TemporaryDirectory(prefix="lockapp-bench-") as workdir:
+            load_app(args.stub_vlc, workdir, args.videos)
+            results = {
+                "started": started.isoformat(timespec="seconds"),
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "vlc": "stub" if args.stub_vlc else vlc.libvlc_get_version().decode(),
+                "args": vars(args),
+                "scenarios": {},
+            }
+            for name in args.scenarios:
+                print(f"Running {name}...", flush=True)
+                results["scenarios"][name] = SCENARIOS[name](args)
+                print(summary_line(name, results["scenarios"][name]), flush=True)
+            os.chdir(REPO_DIR)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+            xvfb.wait()
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as results_file:
+        json.dump(results, results_file, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""Stand-in for python-vlc used by the benchmarks on machines without libVLC.
+
+Only the parts of the API the app uses are provided. Players "decode" on a
+background thread at FPS frames per second and burn DECODE_COST seconds of
+CPU per frame while holding the GIL, so pop-up players compete with the Tk
+loop the way libVLC callbacks and video output do. Frames that miss their
+display slot are dropped and counted as lost pictures. Opening media that
+has not been parsed costs OPEN_COST, parsed media opens in PARSED_OPEN_COST.
+Audio adds AUDIO_COST per frame unless the media has ":no-audio", and each
+":avcodec-skip-loopfilter" level saves LOOP_FILTER_SAVING of the decode cost.
+Events are delivered from the player threads, as libVLC does.
+"""
+import hashlib
+import threading
+import time
+from types import SimpleNamespace
+
+FPS = 25
+DECODE_COST = 0.002
+AUDIO_COST = 0.0005
+LOOP_FILTER_SAVING = 0.05
+OPEN_COST = 0.08
+PARSED_OPEN_COST = 0.01
+PARSE_COST = 0.02
+INSTANCE_COST = 0.05
+PLAYER_COST = 0.005
+TIME_CHANGED_EVERY = 10  # Frames between MediaPlayerTimeChanged events
+CLIP_MS = None  # Fixed clip length; by default derived from the path (10-60 s)
+
+
+def libvlc_get_version():
+    return b"stub"
+
+
+class EventType:
+    MediaPlayerOpening = 1
+    MediaPlayerBuffering = 2
+    MediaPlayerPlaying = 3
+    MediaPlayerPaused = 4
+    MediaPlayerStopped = 5
+    MediaPlayerEndReached = 6
+    MediaPlayerEncounteredError = 7
+    MediaPlayerTimeChanged = 8
+    MediaPlayerVout = 9
+    MediaListPlayerNextItemSet = 10
+
+
+class PlaybackMode:
+    default = 0
+    loop = 1
+    repeat = 2
+
+
+class MediaParseFlag:
+    local = 0
+    network = 1
+
+
+class TrackType:
+    unknown = -1
+    audio = 0
+    video = 1
+    ext = 2
+
+
+class State:
+    NothingSpecial = 0
+    Opening = 1
+    Buffering = 2
+    Playing = 3
+    Paused = 4
+    Stopped = 5
+    Ended = 6
+    Error = 7
+
+
+class MediaStats:
+    FIELDS = ("read_bytes", "input_bitrate", "demux_read_bytes", "demux_bitrate", "demux_corrupted",
+              "demux_discontinuity", "decoded_video", "decoded_audio", "displayed_pictures",
+              "lost_pictures", "played_abuffers", "lost_abuffers", "sent_packets", "sent_bytes",
+              "send_bitrate")
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+
+def _burn(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class EventManager:
+    """One callback per event type, like python-vlc's EventManager."""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def event_attach(self, event_type, callback, *args, **kwargs):
+        self.callbacks[event_type] = (callback, args, kwargs)
+        return 0
+
+    def event_detach(self, event_type):
+        self.callbacks.pop(event_type, None)
+
+    def emit(self, event_type):
+        handler = self.callbacks.get(event_type)
+        if handler:
+            callback, args, kwargs = handler
+            callback(SimpleNamespace(type=event_type), *args, **kwargs)
+
+
+class Media:
+    def __init__(self, path):
+        self.path = path
+        self.parsed = False
+        self.stats = MediaStats()
+        self.options = {}
+        if CLIP_MS is not None:
+            self.duration = CLIP_MS
+        else:
+            self.duration = 10000 + int(hashlib.md5(path.encode()).hexdigest(), 16) % 50000
+
+    def add_option(self, option):
+        name, _, value = option.lstrip(":").partition("=")
+        self.options[name] = value
+
+    def frame_cost(self):
+        cost = DECODE_COST * (1 - LOOP_FILTER_SAVING * int(self.options.get("avcodec-skip-loopfilter", 0)))
+        if "no-audio" not in self.options:
+            cost += AUDIO_COST
+        return cost
+
+    def get_mrl(self):
+        return "file://" + self.path
+
+    def parse(self):
+        if not self.parsed:
+            time.sleep(PARSE_COST)
+            self.parsed = True
+
+    def parse_with_options(self, flags, timeout):
+        threading.Thread(target=self.parse, daemon=True).start()
+        return 0
+
+    def get_duration(self):
+        return self.duration if self.parsed else -1
+
+    def tracks_get(self):
+        if not self.parsed:
+            return []
+        video = SimpleNamespace(width=1280, height=720)
+        return [SimpleNamespace(type=TrackType.video, codec=0x34363268,  # "h264"
+                                u=SimpleNamespace(video=SimpleNamespace(contents=video)))]
+
+    def get_stats(self, stats):
+        for field in MediaStats.FIELDS:
+            setattr(stats, field, getattr(self.stats, field))
+        return True
+
+    def release(self):
+        pass
+
+
+class MediaPlayer:
+    def __init__(self):
+        time.sleep(PLAYER_COST)
+        self.media = None
+        self.events = EventManager()
+        self.state = State.NothingSpecial
+        self.position_ms = 0.0
+        self.rate = 1.0
+        self.volume = 100
+        self.paused = threading.Event()
+        self.stop_event = None
+        self.thread = None
+        self.on_end = None  # Hook for MediaListPlayer, outside the one-callback-per-type slots
+
+    def event_manager(self):
+        return self.events
+
+    def set_media(self, media):
+        self.stop()
+        self.media = media
+
+    def get_media(self):
+        return self.media
+
+    def set_hwnd(self, handle):
+        pass
+
+    def set_xwindow(self, handle):
+        pass
+
+    def set_fullscreen(self, fullscreen):
+        pass
+
+    def audio_set_volume(self, volume):
+        self.volume = volume
+        return 0
+
+    def audio_set_mute(self, mute):
+        pass
+
+    def set_rate(self, rate):
+        self.rate = rate
+        return 0
+
+    def get_rate(self):
+        return self.rate
+
+    def get_state(self):
+        return self.state
+
+    def is_playing(self):
+        return int(self.state == State.Playing and not self.paused.is_set())
+
+    def get_time(self):
+        return int(self.position_ms)
+
+    def set_time(self, ms):
+        self.position_ms = float(ms)
+
+    def get_length(self):
+        return self.media.duration if self.media else -1
+
+    def play(self):
+        if self.media is None:
+            return -1
+        self.paused.clear()
+        if self.state in (State.Opening, State.Playing):
+            return 0
+        if self.state == State.Ended:
+            self.position_ms = 0.0
+        self.state = State.Opening
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(self.media, self.stop_event), daemon=True)
+        self.thread.start()
+        return 0
+
+    def pause(self):
+        if self.paused.is_set():
+            self.paused.clear()
+        else:
+            self.paused.set()
+
+    def set_pause(self, pause):
+        if pause:
+            self.paused.set()
+        else:
+            self.paused.clear()
+
+    def stop(self):
+        # Loop: an end-of-clip callback may restart playback while we join
+        while self.thread is not None:
+            stop_event, thread = self.stop_event, self.thread
+            self.stop_event = self.thread = None
+            stop_event.set()
+            if thread is not threading.current_thread():
+                thread.join()
+        if self.state != State.NothingSpecial:
+            self.state = State.Stopped
+        self.position_ms = 0.0
+        self.paused.clear()
+
+    def release(self):
+        self.stop()
+
+    def _run(self, media, stop_event):
+        stop_event.wait(PARSED_OPEN_COST if media.parsed else OPEN_COST)
+        if stop_event.is_set():
+            return
+        self.state = State.Playing
+        self.events.emit(EventType.MediaPlayerPlaying)
+        frame_time = 1.0 / FPS
+        next_frame = time.monotonic()
+        frames = 0
+        first_frame = True
+        while not stop_event.is_set():
+            if self.paused.is_set():
+                stop_event.wait(frame_time)
+                next_frame = time.monotonic()
+                continue
+            if time.monotonic() - next_frame > frame_time:
+                media.stats.lost_pictures += 1  # Missed its display slot, skip it
+            else:
+                _burn(media.frame_cost())
+                media.stats.decoded_video += 1
+                media.stats.displayed_pictures += 1
+                media.stats.demux_read_bytes += 20000
+                if first_frame:
+                    first_frame = False
+                    self.events.emit(EventType.MediaPlayerVout)
+            frames += 1
+            self.position_ms += frame_time * 1000 * self.rate
+            if frames % TIME_CHANGED_EVERY == 0:
+                self.events.emit(EventType.MediaPlayerTimeChanged)
+            if self.position_ms >= media.duration:
+                self.state = State.Ended
+                self.events.emit(EventType.MediaPlayerEndReached)
+                if self.on_end:
+                    self.on_end()
+                return
+            next_frame += frame_time
+            stop_event.wait(max(0.0, next_frame - time.monotonic()))
+
+
+class MediaList:
+    def __init__(self):
+        self.items = []
+        self.mutex = threading.RLock()
+
+    def lock(self):
+        self.mutex.acquire()
+
+    def unlock(self):
+        self.mutex.release()
+
+    def count(self):
+        return len(self.items)
+
+    def add_media(self, media):
+        self.items.append(media)
+        return 0
+
+    def insert_media(self, media, index):
+        self.items.insert(index, media)
+        return 0
+
+    def remove_index(self, index):
+        del self.items[index]
+        return 0
+
+    def item_at_index(self, index):
+        return self.items[index] if 0 <= index < len(self.items) else None
+
+    def index_of_item(self, media):
+        for index, item in enumerate(self.items):
+            if item is media:
+                return index
+        return -1
+
+    def release(self):
+        pass
+
+
+class MediaListPlayer:
+    def __init__(self):
+        self.player = None
+        self.media_list = None
+        self.mode = PlaybackMode.default
+        self.index = -1
+        self.events = EventManager()
+
+    def event_manager(self):
+        return self.events
+
+    def set_media_player(self, player):
+        self.player = player
+        player.on_end = self._on_end
+
+    def set_media_list(self, media_list):
+        self.media_list = media_list
+
+    def set_playback_mode(self, mode):
+        self.mode = mode
+
+    def play(self):
+        self._play_index(0)
+
+    def next(self):
+        return self._play_index(self.index + 1)
+
+    def stop(self):
+        if self.player:
+            self.player.stop()
+
+    def release(self):
+        if self.player:
+            self.player.on_end = None
+
+    def _on_end(self):
+        if self.mode == PlaybackMode.repeat:
+            self._play_index(self.index)
+        else:
+            self._play_index(self.index + 1)
+
+    def _play_index(self, index):
+        with self.media_list.mutex:
+            count = self.media_list.count()
+            if count == 0:
+                return -1
+            if index >= count:
+                if self.mode != PlaybackMode.loop:
+                    return -1
+                index = 0
+            media = self.media_list.item_at_index(index)
+        self.index = index
+        self.player.set_media(media)
+        self.events.emit(EventType.MediaListPlayerNextItemSet)
+        self.player.play()
+        return 0
+
+
+class Instance:
+    def __init__(self, *args):
+        time.sleep(INSTANCE_COST)
+
+    def media_new(self, path):
+        return Media(path)
+
+    def media_new_path(self, path):
+        return Media(path)
+
+    def media_player_new(self):
+        return MediaPlayer()
+
+    def media_list_new(self):
+        return MediaList()
+
+    def media_list_player_new(self):
+        return MediaListPlayer()
+
+    def release(self):
+        pass
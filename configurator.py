@@ -1,138 +1,82 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
-import subprocess
+import queue
 import re
-from PIL import Image, ImageTk, UnidentifiedImageError
-from datetime import datetime
+import app_config
+import LockTestpy
+from app_config import DEFAULT_PASSWORD, format_value, load_config
+from app_logging import log_message, set_log_level, setup_logging
+from image_assets import AnimationManager, AssetLoader
+from playback_profiles import AUDIO_MODES, SKIP_FRAME_LEVELS, SKIP_LOOP_FILTER_LEVELS
+from video_import import ContentHashIndex, ZipImporter
+from video_scanner import parse_extensions
 
 # --- Constants ---
-CONFIG_FILE = "config.txt"
-LOG_FILE = "Log.txt"
-DEFAULT_PASSWORD = "password"
-MAIN_SCRIPT = "LockTestpy.py"
 CONFIG_IMG_DIR = "ConfigImg"
+CONFIG_IMG_CACHE_DIR = os.path.join(CONFIG_IMG_DIR, ".cache")
+CUSTOM_VIDEO_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "custom_videos")
+CONTENT_HASH_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content_hashes.json")
+IMPORT_POLL_MS = 100
 MAX_IMAGE_WIDTH = 200  # Define a maximum width for images
-GIF_UPDATE_DELAY = 100  # Milliseconds for GIF frame update
-
-# --- Logging ---
-def log_message(message, level="INFO"):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_line = f"[{timestamp}] [{level}] {message}\n"
-    try:
-        with open(LOG_FILE, 'a') as logfile:
-            logfile.write(log_line)
-    except Exception as e:
-        print(f"Error writing to log file: {e}")
 
 # --- Configuration ---
 def save_config(config_data):
     try:
-        with open(CONFIG_FILE, 'w') as config_file:
-            for key, value in config_data.items():
-                config_file.write(f"{key}={value}\n")
-        log_message(f"Saved configuration: {config_data}")
-    except IOError as e:
-        log_message(f"Error saving configuration file: {e}", level="ERROR")
+        app_config.save_config(config_data)
+        log_message("Saved configuration: %s", config_data)
+        return True
+    except OSError as e:
+        log_message("Error saving configuration file: %s", e, level="ERROR")
         messagebox.showerror("Error", f"Failed to save configuration: {e}")
+        return False
+
+# --- Program Launch ---
+def start_lock_app(window):
+    # Runs the player in this interpreter, in a new Toplevel, instead of starting a second Python
+    if not LockTestpy.confirm_start(parent=window):
+        log_message("User chose not to continue.")
+        return
+    config = load_config()
+    set_log_level(config["log_level"])
+    window.withdraw()
+    player_window = tk.Toplevel(window)
+    app = None
+
+    def finish():
+        app.shutdown()
+        window.quit()
 
-def load_config():
-    default_config = {
-        "password": DEFAULT_PASSWORD,
-        "log_level": "INFO",
-        "timer": "",
-        "timer_position": "top_right",
-        "theme": "Light",
-        "mode": "fullscreen",
-        "bg_color": "#000000",
-        "screensaver_image_path": "",
-        "popup_text_file": "",
-        "popup_interval": "0.5",
-        "popup_duration": "5",
-        "popup_video_size": "5",
-        "show_skip_button": "True",
-        "show_password": "True",
-        "show_popup_bg": "True"
-    }
-    if not os.path.exists(CONFIG_FILE):
-        return default_config
-
-    config_dict = {}
-    try:
-        with open(CONFIG_FILE, 'r') as config_file:
-            for line in config_file:
-                if '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    config_dict[key] = value
-        log_message(f"Loaded configuration: {config_dict}")
-        return config_dict
-    except IOError as e:
-        log_message(f"Error loading configuration file: {e}", level="ERROR")
-        messagebox.showerror("Error", f"Failed to load configuration: {e}")
-        return default_config
-
-# --- Script Execution ---
-def start_main_script():
     try:
-        configurator_dir = os.path.dirname(os.path.abspath(__file__))
-        subprocess.Popen(['python', MAIN_SCRIPT], cwd=configurator_dir)
-        log_message("LockTestpy.py started successfully.")
-    except FileNotFoundError:
-        log_message(f"Error: {MAIN_SCRIPT} not found.", level="ERROR")
-        messagebox.showerror("Error", f"{MAIN_SCRIPT} not found in the same directory.")
+        app = LockTestpy.LockApp(player_window, config, on_exit=finish)
+        log_message("Player started in-process.")
     except Exception as e:
-        log_message(f"Failed to start {MAIN_SCRIPT}: {e}", level="ERROR")
-        messagebox.showerror("Error", f"Failed to start {MAIN_SCRIPT}: {e}")
+        # LockApp has already shut down whatever it started before failing
+        log_message("Failed to start the player: %s", e, level="ERROR")
+        player_window.destroy()
+        window.deiconify()
+        messagebox.showerror("Error", f"Failed to start the player: {e}")
 
 # --- Validation ---
 def is_hex_color(color_code):
     return re.match(r'^#([0-9a-fA-F]{3}){1,2}$', color_code) is not None
 
+def label_to_value(choices, label):
+    return next(value for value, text in choices.items() if text == label)
+
 # --- Image Handling ---
-def load_all_images():
+def find_images():
+    # Only lists the folder; decoding happens when a tab is first shown
     images = {}
-    if not os.path.exists(CONFIG_IMG_DIR):
-        return images
-
-    for file in os.listdir(CONFIG_IMG_DIR):
-        try:
-            filepath = os.path.join(CONFIG_IMG_DIR, file)
-            if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                image = Image.open(filepath)
-                image.thumbnail((MAX_IMAGE_WIDTH, 500))  # Initial resize with max width
-                photo_image = ImageTk.PhotoImage(image)
-                images[file.split('.')[0].lower()] = photo_image
-                log_message(f"Loaded image: {file}")
-            elif file.lower().endswith('.gif'):
-                gif_frames = []
-                gif_image = Image.open(filepath)
-                try:
-                    for i in range(gif_image.n_frames):
-                        gif_image.seek(i)
-                        frame = gif_image.copy().convert('RGB')
-                        frame.thumbnail((MAX_IMAGE_WIDTH, 500))
-                        gif_frames.append(ImageTk.PhotoImage(frame))
-                    images[file.split('.')[0].lower()] = gif_frames
-                    log_message(f"Loaded animated GIF: {file} with {len(gif_frames)} frames")
-                except EOFError:
-                    log_message(f"Incomplete GIF file: {file}", level="WARNING")
-        except FileNotFoundError:
-            log_message(f"Image file not found: {file}", level="WARNING")
-        except UnidentifiedImageError:
-            log_message(f"Cannot open image file (unsupported format): {file}", level="WARNING")
-        except Exception as e:
-            log_message(f"Error loading image {file}: {e}", level="ERROR")
+    if os.path.exists(CONFIG_IMG_DIR):
+        for file in os.listdir(CONFIG_IMG_DIR):
+            if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
+                images[file.split('.')[0].lower()] = os.path.join(CONFIG_IMG_DIR, file)
     return images
 
 def get_image(images, name):
     return images.get(name.lower())
 
-def play_gif(label, frames, index=0):
-    if frames:
-        label.config(image=frames[index])
-        label.image = frames[index]
-        label.after(GIF_UPDATE_DELAY, play_gif, label, frames, (index + 1) % len(frames))
-
 # --- File Browsing ---
 def browse_file(title, filetypes, variable):
     filepath = filedialog.askopenfilename(title=title, filetypes=filetypes)
@@ -141,26 +85,75 @@ def browse_file(title, filetypes, variable):
 
 # --- Main Application ---
 def main():
+    setup_logging()
     config = load_config()
+    set_log_level(config["log_level"])
 
     window = tk.Tk()
     window.title("Configurator")
 
-    images = load_all_images()
+    images = find_images()
+    asset_loader = AssetLoader(window, CONFIG_IMG_CACHE_DIR, (MAX_IMAGE_WIDTH, 500))
+    animations = AnimationManager(window)
+    tab_images = {}
 
     style = ttk.Style(window)
     style.theme_use('clam')
 
     tab_control = ttk.Notebook(window)
 
+    importer = None
+
     def browse_videos():
+        nonlocal importer
         zip_path = filedialog.askopenfilename(
             title="Select a ZIP file containing videos",
             filetypes=[("ZIP files", "*.zip")]
         )
         if zip_path:
-            messagebox.showinfo("Info", "Video extraction logic would go here.")
-            log_message(f"User selected video ZIP file: {zip_path}")
+            log_message("User selected video ZIP file: %s", zip_path)
+            extensions = parse_extensions(config["video_extensions"])
+            importer = ZipImporter(zip_path, CUSTOM_VIDEO_FOLDER, ContentHashIndex(CONTENT_HASH_FILE), extensions)
+            importer.start()
+            browse_zip_button.config(state='disabled')
+            cancel_import_button.config(state='normal')
+            import_progress_var.set(0)
+            import_status_var.set("Starting import...")
+            window.after(IMPORT_POLL_MS, poll_import)
+
+    def poll_import():
+        while True:
+            try:
+                message = importer.messages.get_nowait()
+            except queue.Empty:
+                window.after(IMPORT_POLL_MS, poll_import)
+                return
+            if message[0] == "progress":
+                _, done_bytes, total_bytes, name = message
+                import_progress_var.set(done_bytes / total_bytes * 100)
+                import_status_var.set(f"Importing {name}...")
+            else:
+                break
+        browse_zip_button.config(state='normal')
+        cancel_import_button.config(state='disabled')
+        if message[0] == "done":
+            _, imported, skipped, failed, cancelled = message
+            if not cancelled:
+                import_progress_var.set(100)
+            summary = f"{imported} video(s) imported, {skipped} duplicate(s) skipped."
+            if failed:
+                summary += f" {failed} video(s) could not be read (see Log.txt)."
+            import_status_var.set(("Import cancelled. " if cancelled else "Import finished. ") + summary)
+            if not cancelled:
+                messagebox.showinfo("Import Complete", summary)
+        else:
+            import_status_var.set("Import failed.")
+            messagebox.showerror("Import Failed", f"Failed to import videos: {message[1]}")
+
+    def cancel_import():
+        if importer:
+            importer.cancel()
+            import_status_var.set("Cancelling...")
 
     def update_color_preview(new_color):
         color_preview.config(bg=new_color if is_hex_color(new_color) else '')
@@ -184,41 +177,54 @@ def main():
         popup_interval = popup_interval_var.get()
         popup_duration = popup_duration_var.get()
         popup_video_size = popup_video_size_var.get()
+        max_popup_players = max_popup_players_var.get()
+        adaptive_popups = adaptive_popups_var.get()
+        use_default_videos = not use_custom_videos_var.get()
+        volume = volume_var.get()
+        playback_speed = playback_speed_var.get()
+        popup_audio = label_to_value(AUDIO_MODES, popup_audio_var.get())
+        popup_decoder_threads = popup_decoder_threads_var.get()
+        popup_skip_loop_filter = label_to_value(SKIP_LOOP_FILTER_LEVELS, popup_skip_loop_filter_var.get())
+        popup_skip_frame = label_to_value(SKIP_FRAME_LEVELS, popup_skip_frame_var.get())
+        popup_worker_processes = popup_worker_processes_var.get()
+        popup_overlap_tolerance = popup_overlap_tolerance_var.get()
         show_skip_button = show_skip_button_var.get()
         show_password = show_password_var.get()
 
-        # Input validation
-        if timer and not timer.isdigit():
-            messagebox.showerror("Validation Error", "Timer must be a positive integer.")
-            return
-        if not is_hex_color(bg_color):
-            messagebox.showerror("Validation Error", "Invalid background color format. Use #RRGGBB or #RGB.")
-            return
-        try:
-            float(popup_interval)
-            float(popup_duration)
-            video_size = int(popup_video_size)
-            if not 1 <= video_size <= 10:
-                raise ValueError
-        except ValueError:
-            messagebox.showerror("Validation Error", "Invalid numeric input for pop-up settings.")
-            return
-
-        if not timer and show_password:
-            messagebox.showerror("Validation Error", "You must set a timer to enable showing the password.")
-            return
-
-        config_data = {
+        # Keep keys the configurator has no widgets for (e.g. player_pool_size)
+        config_data = dict(config)
+        fields = {
             "password": password, "log_level": log_level, "timer": timer,
             "timer_position": timer_position, "theme": theme, "mode": mode,
             "bg_color": bg_color, "screensaver_image_path": screensaver_image_path,
             "popup_text_file": popup_text_file, "popup_interval": popup_interval,
             "popup_duration": popup_duration, "popup_video_size": popup_video_size,
             "show_skip_button": show_skip_button, "show_password": show_password,
-            "show_popup_bg": show_popup_bg
+            "show_popup_bg": show_popup_bg, "max_popup_players": max_popup_players,
+            "adaptive_popups": adaptive_popups, "use_default_videos": use_default_videos,
+            "volume": volume, "playback_speed": playback_speed, "popup_audio": popup_audio,
+            "popup_decoder_threads": popup_decoder_threads, "popup_skip_loop_filter": popup_skip_loop_filter,
+            "popup_skip_frame": popup_skip_frame, "popup_worker_processes": popup_worker_processes,
+            "popup_overlap_tolerance": popup_overlap_tolerance
         }
-        save_config(config_data)
-        messagebox.showinfo("Success", "Settings saved successfully.")
+
+        # Input validation, with the same rules LockApp applies when it reads the file
+        for key, value in fields.items():
+            try:
+                config_data[key] = app_config.parse_value(key, str(value))
+            except ValueError as e:
+                messagebox.showerror("Validation Error", f"Invalid value for {key}: {e}")
+                return
+
+        if not config_data["timer"] and config_data["show_password"]:
+            messagebox.showerror("Validation Error", "You must set a timer to enable showing the password.")
+            return
+
+        if save_config(config_data):
+            set_log_level(log_level)
+            messagebox.showinfo("Success", "Settings saved successfully.")
+            return True
+        return False
 
     def validate_before_start():
         if not timer_entry.get() and show_password_var.get():
@@ -227,23 +233,22 @@ def main():
         return True
 
     def start_program():
-        if validate_before_start():
-            save_settings()
-            start_main_script()
-            window.quit()
-
-    # --- Helper function for placing images ---
-    def place_image(tab, image_data, row, column, columnspan=1, rowspan=1, sticky="nsew"):
-        if image_data:
-            label = ttk.Label(tab)
-            if isinstance(image_data, list):
-                play_gif(label, image_data)
-            else:
-                label.config(image=image_data)
-                label.image = image_data
-            label.grid(row=row, column=column, columnspan=columnspan, rowspan=rowspan, sticky=sticky, padx=5, pady=5)
-            return label
-        return None
+        if validate_before_start() and save_settings():
+            start_lock_app(window)
+
+    # --- Helper functions for placing images ---
+    def place_image(tab, image_path, row, column, columnspan=1, rowspan=1, sticky="nsew"):
+        # Images are loaded the first time their tab is selected
+        if image_path:
+            tab_images.setdefault(str(tab), []).append(
+                (image_path, dict(row=row, column=column, columnspan=columnspan, rowspan=rowspan, sticky=sticky)))
+
+    def load_tab_images(tab):
+        for image_path, grid_options in tab_images.pop(tab, []):
+            label = ttk.Label(window.nametowidget(tab))
+            label.grid(padx=5, pady=5, **grid_options)
+            asset_loader.load(image_path, lambda photo_image, duration, label=label:
+                              animations.add_frame(label, photo_image, duration))
 
     # --- General Tab ---
     general_tab = ttk.Frame(tab_control)
@@ -253,20 +258,20 @@ def main():
 
     ttk.Label(general_tab, text="New Password:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
     password_entry = ttk.Entry(general_tab, show="*")
-    password_entry.insert(0, config.get("password", DEFAULT_PASSWORD))
+    password_entry.insert(0, config["password"])
     password_entry.grid(row=2, column=0, sticky="ew", padx=5, pady=5)
 
     ttk.Label(general_tab, text="Log Level:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-    log_level_var = tk.StringVar(value=config.get("log_level", "INFO"))
+    log_level_var = tk.StringVar(value=config["log_level"])
     log_levels = ["INFO", "DEBUG", "WARNING", "ERROR"]
     for i, level in enumerate(log_levels):
         ttk.Radiobutton(general_tab, text=level, variable=log_level_var, value=level).grid(row=4 + i, column=0, sticky="w", padx=15)
 
-    show_skip_button_var = tk.BooleanVar(value=config.get("show_skip_button", "True") == "True")
+    show_skip_button_var = tk.BooleanVar(value=config["show_skip_button"])
     show_skip_button_checkbox = ttk.Checkbutton(general_tab, text="Show Skip Button", variable=show_skip_button_var)
     show_skip_button_checkbox.grid(row=4 + len(log_levels), column=0, sticky="w", padx=5, pady=5)
 
-    show_password_var = tk.BooleanVar(value=config.get("show_password", "True") == "True")
+    show_password_var = tk.BooleanVar(value=config["show_password"])
     show_password_checkbox = ttk.Checkbutton(general_tab, text="Show Password", variable=show_password_var)
     show_password_checkbox.grid(row=5 + len(log_levels), column=0, sticky="w", padx=5, pady=5)
 
@@ -280,12 +285,12 @@ def main():
 
     ttk.Label(timer_tab, text="Countdown Timer (seconds):").grid(row=0, column=0, sticky="w", padx=5, pady=5)
     timer_entry = ttk.Entry(timer_tab)
-    timer_entry.insert(0, config.get("timer", ""))
+    timer_entry.insert(0, format_value("timer", config["timer"]))
     timer_entry.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
     timer_entry.bind("<KeyRelease>", lambda event: update_password_checkbox_state())
 
     ttk.Label(timer_tab, text="Timer Position:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-    timer_position_var = tk.StringVar(value=config.get("timer_position", "top_right"))
+    timer_position_var = tk.StringVar(value=config["timer_position"])
     timer_positions = ["top_left", "top_right", "bottom_left", "bottom_right"]
     for i, position in enumerate(timer_positions):
         ttk.Radiobutton(timer_tab, text=position.replace("_", " ").capitalize(), variable=timer_position_var, value=position).grid(row=3 + i, column=0, sticky="w", padx=15)
@@ -300,17 +305,17 @@ def main():
     place_image(appearance_tab, get_image(images, "AppearanceTopRight"), row=0, column=1, sticky="ne")
 
     ttk.Label(appearance_tab, text="Theme:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-    theme_var = tk.StringVar(value=config.get("theme", "Light"))
+    theme_var = tk.StringVar(value=config["theme"])
     themes = ["Light", "Dark"]
     for i, theme in enumerate(themes):
         ttk.Radiobutton(appearance_tab, text=theme, variable=theme_var, value=theme).grid(row=1 + i, column=0, sticky="w", padx=15)
 
     ttk.Label(appearance_tab, text="Background Color:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-    bg_color_var = tk.StringVar(value=config.get("bg_color", "#000000"))
+    bg_color_var = tk.StringVar(value=config["bg_color"])
     bg_color_var.trace_add("write", lambda name, index, mode, sv=bg_color_var: update_color_preview(sv.get()))
     bg_color_entry = ttk.Entry(appearance_tab, textvariable=bg_color_var)
     bg_color_entry.grid(row=4, column=0, sticky="ew", padx=5, pady=5)
-    color_preview = tk.Canvas(appearance_tab, width=20, height=20, bg=config.get("bg_color", "#000000"))
+    color_preview = tk.Canvas(appearance_tab, width=20, height=20, bg=config["bg_color"])
     color_preview.grid(row=4, column=1, sticky="w", padx=5, pady=5)
 
     appearance_tab.grid_columnconfigure(0, weight=1)
@@ -323,20 +328,61 @@ def main():
     place_image(mode_tab, get_image(images, "ModeBottomLeft"), row=1, column=0, sticky="sw")
 
     ttk.Label(mode_tab, text="Select Mode:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-    mode_var = tk.StringVar(value=config.get("mode", "fullscreen"))
+    mode_var = tk.StringVar(value=config["mode"])
     modes = [("Fullscreen (single video)", "fullscreen"), ("Pop-Up Mode (floating videos)", "windowed")]
     for i, (mode_text, mode_value) in enumerate(modes):
         ttk.Radiobutton(mode_tab, text=mode_text, variable=mode_var, value=mode_value).grid(row=1 + i, column=1, sticky="nw", padx=15)
 
     ttk.Label(mode_tab, text="Pop-Up Video Size (1-10):").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-    popup_video_size_var = tk.StringVar(value=config.get("popup_video_size", "5"))
+    popup_video_size_var = tk.StringVar(value=str(config["popup_video_size"]))
     popup_video_size_slider = tk.Scale(mode_tab, from_=1, to=10, orient=tk.HORIZONTAL, variable=popup_video_size_var)
     popup_video_size_slider.grid(row=3, column=1, sticky="ew", padx=5, pady=5)
 
-    show_popup_bg_var = tk.BooleanVar(value=config.get("show_popup_bg", "True") == "True")
+    show_popup_bg_var = tk.BooleanVar(value=config["show_popup_bg"])
     show_popup_bg_checkbox = ttk.Checkbutton(mode_tab, text="Use Pop-Up Background", variable=show_popup_bg_var)
     show_popup_bg_checkbox.grid(row=4, column=1, sticky="w", padx=15)
 
+    ttk.Label(mode_tab, text="Max Live Pop-Up Videos:").grid(row=5, column=0, sticky="w", padx=5, pady=5)
+    max_popup_players_var = tk.StringVar(value=str(config["max_popup_players"]))
+    ttk.Spinbox(mode_tab, from_=1, to=30, textvariable=max_popup_players_var, width=5).grid(row=5, column=1, sticky="w", padx=15, pady=5)
+
+    adaptive_popups_var = tk.BooleanVar(value=config["adaptive_popups"])
+    adaptive_popups_checkbox = ttk.Checkbutton(mode_tab, text="Adaptive Pop-Up Rate (slow down under load)", variable=adaptive_popups_var)
+    adaptive_popups_checkbox.grid(row=6, column=1, sticky="w", padx=15)
+
+    ttk.Label(mode_tab, text="Volume (0-100):").grid(row=7, column=0, sticky="w", padx=5, pady=5)
+    volume_var = tk.IntVar(value=config["volume"])
+    tk.Scale(mode_tab, from_=0, to=100, orient=tk.HORIZONTAL, variable=volume_var).grid(row=7, column=1, sticky="ew", padx=5, pady=5)
+
+    ttk.Label(mode_tab, text="Playback Speed:").grid(row=8, column=0, sticky="w", padx=5, pady=5)
+    playback_speed_var = tk.DoubleVar(value=config["playback_speed"])
+    tk.Scale(mode_tab, from_=0.5, to=2.0, resolution=0.1, orient=tk.HORIZONTAL, variable=playback_speed_var).grid(row=8, column=1, sticky="ew", padx=5, pady=5)
+
+    # Decoding profile for pop-up players
+    ttk.Label(mode_tab, text="Pop-Up Audio:").grid(row=9, column=0, sticky="w", padx=5, pady=5)
+    popup_audio_var = tk.StringVar(value=AUDIO_MODES[config["popup_audio"]])
+    ttk.Combobox(mode_tab, textvariable=popup_audio_var, values=list(AUDIO_MODES.values()), state="readonly").grid(row=9, column=1, sticky="w", padx=15, pady=5)
+
+    ttk.Label(mode_tab, text="Pop-Up Decoder Threads (0 = auto):").grid(row=10, column=0, sticky="w", padx=5, pady=5)
+    popup_decoder_threads_var = tk.StringVar(value=str(config["popup_decoder_threads"]))
+    ttk.Spinbox(mode_tab, from_=0, to=16, textvariable=popup_decoder_threads_var, width=5).grid(row=10, column=1, sticky="w", padx=15, pady=5)
+
+    ttk.Label(mode_tab, text="Pop-Up Skip Loop Filter:").grid(row=11, column=0, sticky="w", padx=5, pady=5)
+    popup_skip_loop_filter_var = tk.StringVar(value=SKIP_LOOP_FILTER_LEVELS[config["popup_skip_loop_filter"]])
+    ttk.Combobox(mode_tab, textvariable=popup_skip_loop_filter_var, values=list(SKIP_LOOP_FILTER_LEVELS.values()), state="readonly").grid(row=11, column=1, sticky="w", padx=15, pady=5)
+
+    ttk.Label(mode_tab, text="Pop-Up Skip Frames:").grid(row=12, column=0, sticky="w", padx=5, pady=5)
+    popup_skip_frame_var = tk.StringVar(value=SKIP_FRAME_LEVELS[config["popup_skip_frame"]])
+    ttk.Combobox(mode_tab, textvariable=popup_skip_frame_var, values=list(SKIP_FRAME_LEVELS.values()), state="readonly").grid(row=12, column=1, sticky="w", padx=15, pady=5)
+
+    ttk.Label(mode_tab, text="Pop-Up Worker Processes (0 = off):").grid(row=13, column=0, sticky="w", padx=5, pady=5)
+    popup_worker_processes_var = tk.StringVar(value=str(config["popup_worker_processes"]))
+    ttk.Spinbox(mode_tab, from_=0, to=16, textvariable=popup_worker_processes_var, width=5).grid(row=13, column=1, sticky="w", padx=15, pady=5)
+
+    ttk.Label(mode_tab, text="Pop-Up Overlap Tolerance (0-1):").grid(row=14, column=0, sticky="w", padx=5, pady=5)
+    popup_overlap_tolerance_var = tk.StringVar(value=str(config["popup_overlap_tolerance"]))
+    ttk.Spinbox(mode_tab, from_=0, to=1, increment=0.05, textvariable=popup_overlap_tolerance_var, width=5).grid(row=14, column=1, sticky="w", padx=15, pady=5)
+
     mode_tab.grid_columnconfigure(0, weight=1)
     mode_tab.grid_columnconfigure(1, weight=1)
 
@@ -349,7 +395,7 @@ def main():
     ttk.Label(screensaver_tab, text="Pause Video with 'F1' Key").grid(row=1, column=0, sticky="w", padx=5, pady=5)
 
     ttk.Label(screensaver_tab, text="Select Screen Saver Image:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-    screensaver_image_path_var = tk.StringVar(value=config.get("screensaver_image_path", ""))
+    screensaver_image_path_var = tk.StringVar(value=config["screensaver_image_path"])
     ttk.Entry(screensaver_tab, textvariable=screensaver_image_path_var, state="readonly").grid(row=3, column=0, sticky="ew", padx=5, pady=5)
     ttk.Button(screensaver_tab, text="Browse", command=lambda: browse_file("Select an image", [("Image files", "*.jpg;*.jpeg;*.png;*.bmp")], screensaver_image_path_var)).grid(row=3, column=1, sticky="w", padx=5, pady=5)
 
@@ -363,16 +409,16 @@ def main():
     place_image(popup_tab, get_image(images, "PopupBottomRight"), row=1, column=1, sticky="se")
 
     ttk.Label(popup_tab, text="Upload Text File for Pop-Ups:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-    popup_text_file_var = tk.StringVar(value=config.get("popup_text_file", ""))
+    popup_text_file_var = tk.StringVar(value=config["popup_text_file"])
     ttk.Entry(popup_tab, textvariable=popup_text_file_var, state="readonly").grid(row=1, column=0, sticky="ew", padx=5, pady=5)
     ttk.Button(popup_tab, text="Browse", command=lambda: browse_file("Select a text file", [("Text files", "*.txt")], popup_text_file_var)).grid(row=1, column=1, sticky="w", padx=5, pady=5)
 
     ttk.Label(popup_tab, text="Pop-Up Interval (seconds):").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-    popup_interval_var = tk.StringVar(value=config.get("popup_interval", "0.5"))
+    popup_interval_var = tk.StringVar(value=str(config["popup_interval"]))
     ttk.Entry(popup_tab, textvariable=popup_interval_var).grid(row=3, column=0, sticky="ew", padx=5, pady=5)
 
     ttk.Label(popup_tab, text="Pop-Up Duration (seconds):").grid(row=4, column=0, sticky="w", padx=5, pady=5)
-    popup_duration_var = tk.StringVar(value=config.get("popup_duration", "5"))
+    popup_duration_var = tk.StringVar(value=str(config["popup_duration"]))
     ttk.Entry(popup_tab, textvariable=popup_duration_var).grid(row=5, column=0, sticky="ew", padx=5, pady=5)
 
     popup_tab.grid_columnconfigure(0, weight=1)
@@ -384,12 +430,25 @@ def main():
 
     place_image(video_import_tab, get_image(images, "VideoImportTopRight"), row=0, column=1, sticky="ne")
 
-    ttk.Button(video_import_tab, text="Browse ZIP", command=browse_videos).grid(row=0, column=0, sticky="ew", padx=5, pady=5)
+    browse_zip_button = ttk.Button(video_import_tab, text="Browse ZIP", command=browse_videos)
+    browse_zip_button.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
+
+    import_progress_var = tk.DoubleVar(value=0)
+    ttk.Progressbar(video_import_tab, variable=import_progress_var, maximum=100).grid(row=1, column=0, sticky="ew", padx=5, pady=5)
+    import_status_var = tk.StringVar(value="")
+    ttk.Label(video_import_tab, textvariable=import_status_var).grid(row=2, column=0, sticky="w", padx=5, pady=5)
+    cancel_import_button = ttk.Button(video_import_tab, text="Cancel Import", command=cancel_import, state='disabled')
+    cancel_import_button.grid(row=3, column=0, sticky="w", padx=5, pady=5)
+
+    use_custom_videos_var = tk.BooleanVar(value=not config["use_default_videos"])
+    ttk.Checkbutton(video_import_tab, text="Play Imported Videos Instead of Defaults", variable=use_custom_videos_var).grid(row=4, column=0, sticky="w", padx=5, pady=5)
 
     video_import_tab.grid_columnconfigure(0, weight=1)
     video_import_tab.grid_columnconfigure(1, weight=0)
 
     tab_control.pack(expand=1, fill="both")
+    tab_control.bind("<<NotebookTabChanged>>", lambda event: load_tab_images(tab_control.select()))
+    window.after_idle(lambda: load_tab_images(tab_control.select()))
 
     button_frame = ttk.Frame(window)
     button_frame.pack(pady=10)
@@ -397,6 +456,8 @@ def main():
     ttk.Button(button_frame, text="Start Program", command=start_program).pack(side="left", padx=10)
 
     update_password_checkbox_state()
+    # libVLC loads in the background while settings are edited, so Start Program is quick
+    window.after_idle(LockTestpy.start_heavy_imports)
     window.mainloop()
 
 if __name__ == "__main__":
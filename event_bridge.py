@@ -0,0 +1,87 @@
+"""Carries libVLC event callbacks over to the Tk thread.
+
+libVLC runs event callbacks on its own threads, where calling back into
+libVLC (play, stop, event_detach) can deadlock and touching Tk is unsafe.
+The bridge's callbacks only append a small record to a deque; a single
+after() tick on the Tk thread drains them in batches and runs the handlers.
+"""
+import collections
+import itertools
+import logging
+
+logger = logging.getLogger(__name__)
+
+POLL_MS = 50
+MAX_BATCH = 256  # Records handled per tick; the rest wait for an immediate follow-up tick
+
+
+class EventBridge:
+    def __init__(self, master, poll_ms=POLL_MS):
+        self.master = master
+        self.poll_ms = poll_ms
+        self.pending = collections.deque()  # append() and popleft() are atomic, so no lock is needed
+        self.subscriptions = {}  # token -> (event_manager, event_types, handler)
+        self.tokens = itertools.count()
+        self.job = None
+        self.delivered = collections.Counter()
+        self.coalesced = 0
+        self.stale = 0
+
+    def start(self):
+        if self.job is None:
+            self.job = self.master.after(self.poll_ms, self.drain)
+
+    def stop(self):
+        if self.job is not None:
+            self.master.after_cancel(self.job)
+            self.job = None
+
+    def subscribe(self, event_manager, events, handler):
+        """Route libVLC events to handler(kind) on the Tk thread.
+
+        events maps libVLC event types to kind names. Returns a token for
+        unsubscribe(); events still queued for it are dropped after that.
+        """
+        token = next(self.tokens)
+        for event_type, kind in events.items():
+            event_manager.event_attach(event_type, self._push, token, kind)
+        self.subscriptions[token] = (event_manager, tuple(events), handler)
+        return token
+
+    def unsubscribe(self, token):
+        subscription = self.subscriptions.pop(token, None)
+        if subscription:
+            event_manager, event_types, _ = subscription
+            for event_type in event_types:
+                event_manager.event_detach(event_type)
+
+    def _push(self, event, token, kind):
+        # Runs on a libVLC thread
+        self.pending.append((token, kind))
+
+    def drain(self):
+        batch = []
+        seen = set()
+        while self.pending and len(batch) < MAX_BATCH:
+            record = self.pending.popleft()
+            if record in seen:
+                self.coalesced += 1  # e.g. two end-reached events for one player
+                continue
+            seen.add(record)
+            batch.append(record)
+        for token, kind in batch:
+            # Looked up per record: a handler may unsubscribe others in the same batch
+            subscription = self.subscriptions.get(token)
+            if subscription is None:
+                self.stale += 1
+                continue
+            self.delivered[kind] += 1
+            try:
+                subscription[2](kind)
+            except Exception as e:
+                logger.error("Error handling libVLC %s event: %s", kind, e)
+        self.job = self.master.after(1 if self.pending else self.poll_ms, self.drain)
+
+    def log_stats(self):
+        delivered = ", ".join(f"{count} {kind}" for kind, count in sorted(self.delivered.items())) or "none"
+        logger.info("libVLC events: %s delivered, %d coalesced, %d stale", delivered, self.coalesced, self.stale)
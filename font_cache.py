@@ -0,0 +1,74 @@
+import logging
+from collections import OrderedDict
+from tkinter import font
+
+logger = logging.getLogger(__name__)
+
+TEXT_PADDING = 4  # Pixels around measured text, matching the label's own padding
+
+
+class FontCache:
+    """Font family catalogue plus LRU caches of Font objects and text sizes."""
+
+    def __init__(self, root, max_fonts=64, max_sizes=1024):
+        self.root = root
+        self.families = font.families(root)
+        self.max_fonts = max_fonts
+        self.max_sizes = max_sizes
+        self.fonts = OrderedDict()
+        self.sizes = OrderedDict()
+        self.font_hits = self.font_misses = 0
+        self.size_hits = self.size_misses = 0
+        self.renders = 0
+        self.render_total = 0.0
+        self.render_max = 0.0
+
+    def get_font(self, family, size):
+        key = (family, size)
+        popup_font = self.fonts.get(key)
+        if popup_font is not None:
+            self.font_hits += 1
+            self.fonts.move_to_end(key)
+            return popup_font
+        self.font_misses += 1
+        popup_font = font.Font(root=self.root, family=family, size=size, weight="bold")
+        self.fonts[key] = popup_font
+        if len(self.fonts) > self.max_fonts:
+            self.fonts.popitem(last=False)
+        return popup_font
+
+    def measure(self, text, family, size):
+        key = (text, family, size)
+        dimensions = self.sizes.get(key)
+        if dimensions is not None:
+            self.size_hits += 1
+            self.sizes.move_to_end(key)
+            return dimensions
+        self.size_misses += 1
+        popup_font = self.get_font(family, size)
+        dimensions = (popup_font.measure(text) + 2 * TEXT_PADDING,
+                      popup_font.metrics('linespace') + 2 * TEXT_PADDING)
+        self.sizes[key] = dimensions
+        if len(self.sizes) > self.max_sizes:
+            self.sizes.popitem(last=False)
+        return dimensions
+
+    def clear(self):
+        # Font objects delete their Tk fonts when collected
+        self.fonts.clear()
+        self.sizes.clear()
+
+    def record_render(self, seconds):
+        self.renders += 1
+        self.render_total += seconds
+        self.render_max = max(self.render_max, seconds)
+
+    def log_stats(self):
+        def rate(hits, misses):
+            return hits / (hits + misses) * 100 if hits + misses else 0.0
+        average = self.render_total / self.renders * 1000 if self.renders else 0.0
+        logger.info("Text pop-up cache: fonts %.1f%% hit (%d cached), sizes %.1f%% hit (%d cached), "
+                    "%d renders, avg %.2f ms, max %.2f ms",
+                    rate(self.font_hits, self.font_misses), len(self.fonts),
+                    rate(self.size_hits, self.size_misses), len(self.sizes),
+                    self.renders, average, self.render_max * 1000)
@@ -0,0 +1,245 @@
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+
+from PIL import Image, ImageTk, UnidentifiedImageError
+
+from resource_tracker import resources
+
+logger = logging.getLogger(__name__)
+
+POLL_MS = 30
+FRAMES_PER_POLL = 8  # PhotoImage conversions per Tk tick, keeps the UI responsive
+DEFAULT_FRAME_MS = 100  # For GIF frames without a duration
+MIN_FRAME_MS = 20  # Shorter GIF delays are stretched to this, as browsers do
+
+
+class AssetLoader:
+    """Decodes and thumbnails images on worker threads, with an on-disk frame cache.
+
+    Thumbnailed frames are stored as PNGs under cache_dir, keyed by file name,
+    mtime and target width. PIL work happens off the Tk thread; frames are
+    turned into PhotoImages on the Tk thread a few at a time.
+    """
+
+    def __init__(self, widget, cache_dir, max_size):
+        self.widget = widget
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.results = queue.Queue()
+        self.active = 0
+        self.polling = False
+
+    def load(self, path, on_frame):
+        self.active += 1
+        threading.Thread(target=self._decode, args=(path, on_frame), daemon=True).start()
+        if not self.polling:
+            self.polling = True
+            self.widget.after(POLL_MS, self._poll)
+
+    def _decode(self, path, on_frame):
+        try:
+            for frame, duration in self._frames(path):
+                self.results.put((on_frame, frame, duration))
+        except FileNotFoundError:
+            logger.warning("Image file not found: %s", path)
+        except UnidentifiedImageError:
+            logger.warning("Cannot open image file (unsupported format): %s", path)
+        except Exception as e:
+            logger.error("Error loading image %s: %s", path, e)
+        finally:
+            self.results.put(None)
+
+    def _poll(self):
+        for _ in range(FRAMES_PER_POLL):
+            try:
+                item = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self.active -= 1
+                continue
+            on_frame, frame, duration = item
+            try:
+                on_frame(resources.track("photo_image", ImageTk.PhotoImage(frame), explicit=False), duration)
+            except Exception as e:
+                logger.error("Error displaying image frame: %s", e)
+        if self.active or not self.results.empty():
+            self.widget.after(POLL_MS, self._poll)
+        else:
+            self.polling = False
+
+    def _entry_dir(self, path):
+        name = os.path.basename(path)
+        mtime = os.stat(path).st_mtime_ns
+        return name, os.path.join(self.cache_dir, f"{name}-{mtime}-{self.max_size[0]}x{self.max_size[1]}")
+
+    def _frames(self, path):
+        name, entry_dir = self._entry_dir(path)
+        meta_path = os.path.join(entry_dir, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r') as meta_file:
+                durations = json.load(meta_file)["durations"]
+            for index, duration in enumerate(durations):
+                with Image.open(os.path.join(entry_dir, f"frame_{index:04}.png")) as frame:
+                    frame.load()
+                    yield frame.copy(), duration
+            return
+
+        # Stale entries for older versions of this file
+        if os.path.isdir(self.cache_dir):
+            for entry in os.listdir(self.cache_dir):
+                if entry.startswith(name + "-") and os.path.join(self.cache_dir, entry) != entry_dir:
+                    shutil.rmtree(os.path.join(self.cache_dir, entry), ignore_errors=True)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        durations = []
+        with Image.open(path) as image:
+            try:
+                for index in range(getattr(image, 'n_frames', 1)):
+                    image.seek(index)
+                    frame = image.copy().convert('RGB')
+                    frame.thumbnail(self.max_size)
+                    frame.save(os.path.join(entry_dir, f"frame_{index:04}.png"))
+                    durations.append(image.info.get('duration', 0))
+                    yield frame, durations[-1]
+            except EOFError:
+                logger.warning("Incomplete GIF file: %s", path)
+        # Only a fully written entry gets its meta file, so partial caches are redone
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, 'w') as meta_file:
+            json.dump({"durations": durations}, meta_file)
+        os.replace(tmp_path, meta_path)
+        logger.info("Cached %d thumbnail frame(s) for %s", len(durations), name)
+
+
+def fit_image(path, size):
+    with Image.open(path) as image:
+        image.draft('RGB', size)  # JPEGs decode straight at a reduced scale
+        frame = image.convert('RGB')
+    frame.thumbnail(size, Image.LANCZOS)
+    return frame
+
+
+class FittedImage:
+    """A single image decoded and shrunk to fit a size on a worker thread, kept as a ready PhotoImage.
+
+    The cached image is keyed by path, file mtime and size; preload() is cheap
+    to call repeatedly and only decodes again when one of them changes. A key
+    that failed to decode is not tried again until it changes.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.key = None
+        self.photo = None
+        self.pending = None
+        self.failed = None
+        self.results = queue.Queue()
+
+    def _key(self, path, size):
+        try:
+            return path, os.stat(path).st_mtime_ns, tuple(size)
+        except OSError:
+            return None
+
+    def preload(self, path, size):
+        key = self._key(path, size)
+        if key is None or key in (self.key, self.pending, self.failed):
+            return
+        polling = self.pending is not None
+        self.pending = key
+        threading.Thread(target=self._decode, args=(key,), daemon=True).start()
+        if not polling:
+            self.widget.after(POLL_MS, self._poll)
+
+    def _decode(self, key):
+        try:
+            self.results.put((key, fit_image(key[0], key[2])))
+        except Exception as e:
+            # Anything, e.g. Image.DecompressionBombError; _poll must always get a result
+            logger.error("Error loading image %s: %s", key[0], e)
+            self.results.put((key, None))
+
+    def _poll(self):
+        while True:
+            try:
+                key, frame = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if key == self.pending:
+                self.pending = None
+                if frame is not None:
+                    self._store(key, frame)
+                else:
+                    self.failed = key
+        if self.pending is not None:
+            self.widget.after(POLL_MS, self._poll)
+
+    def _store(self, key, frame):
+        self.key = key
+        self.photo = resources.track("photo_image", ImageTk.PhotoImage(frame), explicit=False)
+        logger.info("Prepared %s at %dx%d", os.path.basename(key[0]), frame.width, frame.height)
+
+    def get(self, path, size):
+        """The PhotoImage for path at size, decoding it now if the preload is missing or stale."""
+        key = self._key(path, size)
+        if key is None:
+            raise FileNotFoundError(path)
+        if key != self.key:
+            self.pending = None  # Any preload still running is superseded
+            self._store(key, fit_image(path, size))
+        return self.photo
+
+
+class AnimationManager:
+    """Plays every animated label from one after() ticker, each frame for its own GIF duration.
+
+    Labels that are not viewable (on another tab, or the window is minimised
+    or withdrawn) are skipped. When nothing is viewable the ticker stops, and
+    a <Map> event anywhere in the window starts it again.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.animations = {}  # label -> [frames, durations, index, due]
+        self.job = None
+        widget.winfo_toplevel().bind("<Map>", self.wake, add="+")
+
+    def add_frame(self, label, photo_image, duration):
+        animation = self.animations.setdefault(label, [[], [], 0, 0.0])
+        frames, durations = animation[0], animation[1]
+        frames.append(photo_image)
+        durations.append((duration or DEFAULT_FRAME_MS) / 1000)
+        if len(frames) == 1:
+            label.config(image=photo_image)
+            animation[3] = time.monotonic() + durations[0]
+        elif len(frames) == 2:
+            self.wake()
+
+    def wake(self, event=None):
+        if self.job is None:
+            self.job = self.widget.after_idle(self._tick)
+
+    def _tick(self):
+        now = time.monotonic()
+        next_due = None
+        for label, animation in self.animations.items():
+            frames, durations, index, due = animation
+            if len(frames) < 2 or not label.winfo_viewable():
+                continue
+            if now >= due:
+                # Frames may still be streaming in from the loader; the lists grow as they arrive
+                index = (index + 1) % len(frames)
+                label.config(image=frames[index])
+                due = now + max(durations[index], MIN_FRAME_MS / 1000)
+                animation[2], animation[3] = index, due
+            next_due = due if next_due is None else min(next_due, due)
+        if next_due is None:
+            self.job = None  # Idle until something is mapped again
+        else:
+            self.job = self.widget.after(max(1, int((next_due - now) * 1000)), self._tick)
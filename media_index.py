@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+
+from app_config import save_json
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+SAVE_EVERY = 20  # Probes between intermediate saves
+
+
+def fourcc_to_str(fourcc):
+    return struct.pack('<I', fourcc).decode('ascii', 'replace').strip()
+
+
+class MediaIndex:
+    """On-disk cache of video metadata, filled by a background worker.
+
+    Entries are keyed by path and only trusted while the file's size and
+    mtime still match. Lookups never touch the disk or libVLC.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.pending = queue.Queue()
+        self.worker = None
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r') as index_file:
+                data = json.load(index_file)
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data.get("entries", {})
+            logger.info("Loaded media index with %d entries", len(self.entries))
+        except (OSError, ValueError) as e:
+            logger.error("Error loading media index: %s", e)
+
+    def save(self):
+        with self.lock:
+            data = {"version": INDEX_VERSION, "entries": dict(self.entries)}
+        save_json(data, self.index_path, "media index")
+
+    def lookup(self, path):
+        return self.entries.get(path)
+
+    def get_duration(self, path):
+        entry = self.entries.get(path)
+        return entry["duration"] if entry else 0
+
+    def start(self, paths=()):
+        self.add_paths(paths)
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._run, name="MediaIndexWorker", daemon=True)
+            self.worker.start()
+
+    def add_paths(self, paths):
+        for path in paths:
+            self.pending.put(path)
+
+    def stop(self, timeout=2.0):
+        if self.worker is not None:
+            self.pending.put(None)
+            self.worker.join(timeout)
+            self.worker = None
+        self.save()
+
+    def _is_current(self, path, st):
+        entry = self.entries.get(path)
+        return entry is not None and entry["size"] == st.st_size and entry["mtime"] == st.st_mtime_ns
+
+    def _run(self):
+        import vlc  # Imported here so loading this module stays cheap at startup
+        instance = vlc.Instance("--no-xlib", "--quiet", "--no-audio", "--no-video")
+        with self.lock:
+            for path in [p for p in self.entries if not os.path.exists(p)]:
+                del self.entries[path]
+        probed = 0
+        try:
+            while True:
+                path = self.pending.get()
+                if path is None:
+                    break
+                try:
+                    st = os.stat(path)
+                    if self._is_current(path, st):
+                        continue
+                    entry = self._probe(instance, path)
+                    entry.update(size=st.st_size, mtime=st.st_mtime_ns)
+                    with self.lock:
+                        self.entries[path] = entry
+                    probed += 1
+                except Exception as e:
+                    logger.error("Error indexing %s: %s", path, e)
+                    continue
+                if probed % SAVE_EVERY == 0 or self.pending.empty():
+                    self.save()
+        finally:
+            instance.release()
+        if probed:
+            logger.info("Media index worker probed %d new or changed files", probed)
+
+    def _probe(self, instance, path):
+        import vlc
+        media = instance.media_new_path(path)
+        try:
+            media.parse()
+            entry = {"duration": max(media.get_duration(), 0), "width": 0, "height": 0, "codec": ""}
+            for track in media.tracks_get() or ():
+                if track.type == vlc.TrackType.video:
+                    entry["width"] = track.u.video.contents.width
+                    entry["height"] = track.u.video.contents.height
+                    entry["codec"] = fourcc_to_str(track.codec)
+                    break
+            return entry
+        finally:
+            media.release()
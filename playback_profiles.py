@@ -0,0 +1,27 @@
+"""Per-role libVLC media options.
+
+The main player keeps libVLC's defaults. Pop-ups are small, many and short
+lived, so they decode with fewer threads, can skip the deblocking loop filter
+and frames, and usually leave audio to a single "audio leader" or to nobody.
+"""
+
+# Configurator labels, keyed by config value
+AUDIO_MODES = {"all": "Every pop-up", "leader": "One pop-up at a time", "off": "Muted"}
+SKIP_LOOP_FILTER_LEVELS = {0: "None", 1: "Non-reference frames", 2: "Bidirectional frames",
+                           3: "Non-key frames", 4: "All frames"}
+SKIP_FRAME_LEVELS = {-1: "None", 0: "Default", 1: "Non-reference frames", 2: "Bidirectional frames",
+                     3: "Non-key frames"}
+
+
+def popup_media_options(decoder_threads, skip_loop_filter, skip_frame, audio=True):
+    options = [f":avcodec-threads={decoder_threads}",
+               f":avcodec-skip-loopfilter={skip_loop_filter}",
+               f":avcodec-skip-frame={skip_frame}"]
+    if not audio:
+        options.append(":no-audio")
+    return options
+
+
+def apply_options(media, options):
+    for option in options:
+        media.add_option(option)
@@ -0,0 +1,106 @@
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from app_config import save_json
+from popup_scheduler import read_media_stats
+
+logger = logging.getLogger(__name__)
+
+# Cumulative libVLC counters; lost_pictures are pictures dropped for being late
+COUNTERS = ("decoded_video", "displayed_pictures", "lost_pictures", "lost_abuffers",
+            "demux_read_bytes", "demux_corrupted", "demux_discontinuity")
+SUMMARY_TOP = 5
+SUMMARY_MIN_FRAMES = 100  # Files with fewer frames are too noisy to rank
+
+
+def empty_totals():
+    totals = dict.fromkeys(COUNTERS, 0)
+    totals.update(seconds=0.0, kbps_sum=0.0, kbps_samples=0, kbps_max=0.0)
+    return totals
+
+
+def drop_ratio(totals):
+    frames = totals["displayed_pictures"] + totals["lost_pictures"]
+    return totals["lost_pictures"] / frames if frames else 0.0
+
+
+class PlaybackStats:
+    """Per-file, per-mode playback counters sampled from libVLC media statistics.
+
+    libVLC counters are cumulative per media, so each playback is sampled under
+    its own key and only the increase since the previous sample is added.
+    File totals persist across runs in the metrics file; mode totals cover the
+    current session.
+    """
+
+    def __init__(self, metrics_path):
+        self.metrics_path = metrics_path
+        self.files = {}  # path -> mode -> totals
+        self.session = {}  # mode -> totals
+        self.last = {}  # key -> (counters, sampled_at)
+        self.started = datetime.now().isoformat(timespec="seconds")
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.metrics_path):
+            return
+        try:
+            with open(self.metrics_path, 'r') as metrics_file:
+                self.files = json.load(metrics_file).get("files", {})
+        except (OSError, ValueError) as e:
+            logger.error("Error loading playback metrics: %s", e)
+
+    def save(self):
+        data = {"updated": datetime.now().isoformat(timespec="seconds"), "session_started": self.started,
+                "session": self.session, "files": self.files}
+        save_json(data, self.metrics_path, "playback metrics", indent=1)
+
+    def sample(self, key, media, path, mode):
+        stats = read_media_stats(media)
+        if stats is None or not path:
+            return
+        now = time.monotonic()
+        counters = {name: getattr(stats, name) for name in COUNTERS}
+        last_counters, last_at = self.last.get(key, (None, None))
+        self.last[key] = (counters, now)
+        delta = {}
+        for name, value in counters.items():
+            previous = last_counters[name] if last_counters else 0
+            delta[name] = value - previous if value >= previous else value  # Counters reset with new media
+        kbps = stats.demux_bitrate * 8000  # libVLC reports bytes per millisecond
+        for totals in (self.files.setdefault(path, {}).setdefault(mode, empty_totals()),
+                       self.session.setdefault(mode, empty_totals())):
+            for name, value in delta.items():
+                totals[name] += value
+            if last_at is not None:
+                totals["seconds"] += now - last_at
+            if kbps > 0:
+                totals["kbps_sum"] += kbps
+                totals["kbps_samples"] += 1
+                totals["kbps_max"] = max(totals["kbps_max"], kbps)
+
+    def finish(self, key, media, path, mode):
+        """Take a last sample before the media goes away and forget the key."""
+        self.sample(key, media, path, mode)
+        self.last.pop(key, None)
+
+    def log_summary(self):
+        for mode, totals in sorted(self.session.items()):
+            logger.info("Playback (%s): %d pictures displayed, %d late/dropped (%.1f%%), "
+                        "%d demux discontinuities, %d corrupted blocks, %d audio buffers lost",
+                        mode, totals["displayed_pictures"], totals["lost_pictures"], drop_ratio(totals) * 100,
+                        totals["demux_discontinuity"], totals["demux_corrupted"], totals["lost_abuffers"])
+        ranked = [(drop_ratio(modes["popup"]), path, modes["popup"]) for path, modes in self.files.items()
+                  if "popup" in modes and modes["popup"]["displayed_pictures"] + modes["popup"]["lost_pictures"]
+                  >= SUMMARY_MIN_FRAMES]
+        ranked.sort(reverse=True)
+        for ratio, path, totals in ranked[:SUMMARY_TOP]:
+            if ratio <= 0:
+                break
+            mean_kbps = totals["kbps_sum"] / totals["kbps_samples"] if totals["kbps_samples"] else 0.0
+            logger.info("Heavy in pop-up mode: %s drops %.1f%% of pictures (demux %.0f kb/s avg, %.0f max)",
+                        os.path.basename(path), ratio * 100, mean_kbps, totals["kbps_max"])
+        self.save()
@@ -0,0 +1,61 @@
+import logging
+
+from resource_tracker import resources
+
+logger = logging.getLogger(__name__)
+
+STATS_EVERY = 100  # Checkouts between hit/miss log lines
+
+
+class PlayerPool:
+    """Bounded pool of warm libVLC media players sharing one instance."""
+
+    def __init__(self, instance, max_size=4, prewarm=2):
+        self.instance = instance
+        self.max_size = max_size
+        self.idle = []
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        for _ in range(min(prewarm, max_size)):
+            self.idle.append(resources.track("media_player", self.instance.media_player_new()))
+
+    def acquire(self):
+        if self.idle:
+            self.hits += 1
+            player = self.idle.pop()
+        else:
+            self.misses += 1
+            player = resources.track("media_player", self.instance.media_player_new())
+        if (self.hits + self.misses) % STATS_EVERY == 0:
+            self.log_stats()
+        return player
+
+    def release(self, player):
+        try:
+            player.stop()
+        except Exception as e:
+            logger.error("Error stopping pooled player: %s", e)
+        if len(self.idle) < self.max_size:
+            self.idle.append(player)
+        else:
+            self.discarded += 1
+            self._release(player)
+
+    def trim(self, keep):
+        """Release idle players beyond keep."""
+        while len(self.idle) > keep:
+            self._release(self.idle.pop(0))
+
+    def close(self):
+        self.trim(0)
+
+    def _release(self, player):
+        player.release()
+        resources.release("media_player", player)
+
+    def log_stats(self):
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0.0
+        logger.info("Player pool: %d hits, %d misses (%.1f%% hit rate), %d discarded, %d idle",
+                    self.hits, self.misses, hit_rate, self.discarded, len(self.idle))
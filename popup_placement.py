@@ -0,0 +1,88 @@
+import collections
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+CELL = 128  # Grid cell size in pixels
+CANDIDATES = 12  # Random positions tried per pop-up
+
+
+class PopupPlacer:
+    """Picks pop-up positions that avoid the pop-ups already on screen.
+
+    Live rectangles are bucketed in a grid of CELL-pixel cells, so scoring a
+    candidate only looks at the windows in the cells it covers. The first
+    candidate whose overlap is at most `tolerance` of its own area wins;
+    otherwise the least overlapped one is used.
+    """
+
+    def __init__(self, width, height, tolerance=0.1, rng=random):
+        self.width = width
+        self.height = height
+        self.tolerance = tolerance
+        self.rng = rng
+        self.rects = {}  # key -> (x, y, width, height)
+        self.grid = collections.defaultdict(set)  # (column, row) -> keys
+        self.placed = 0
+        self.clear = 0
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+
+    def _cells(self, x, y, width, height):
+        for column in range(x // CELL, (x + width - 1) // CELL + 1):
+            for row in range(y // CELL, (y + height - 1) // CELL + 1):
+                yield column, row
+
+    def overlap(self, x, y, width, height):
+        """Area of (x, y, width, height) covered by live pop-ups; overlaps between them count twice."""
+        neighbours = set()
+        for cell in self._cells(x, y, width, height):
+            neighbours.update(self.grid.get(cell, ()))
+        area = 0
+        for key in neighbours:
+            other_x, other_y, other_width, other_height = self.rects[key]
+            overlap_width = min(x + width, other_x + other_width) - max(x, other_x)
+            overlap_height = min(y + height, other_y + other_height) - max(y, other_y)
+            if overlap_width > 0 and overlap_height > 0:
+                area += overlap_width * overlap_height
+        return area
+
+    def place(self, width, height):
+        max_x = max(0, self.width - width)
+        max_y = max(0, self.height - height)
+        allowed = self.tolerance * width * height
+        best = None
+        for _ in range(CANDIDATES):
+            x = self.rng.randint(0, max_x)
+            y = self.rng.randint(0, max_y)
+            area = self.overlap(x, y, width, height)
+            if best is None or area < best[0]:
+                best = (area, x, y)
+            if area <= allowed:
+                self.clear += 1
+                break
+        self.placed += 1
+        return best[1], best[2]
+
+    def add(self, key, x, y, width, height):
+        self.remove(key)
+        self.rects[key] = (x, y, width, height)
+        for cell in self._cells(x, y, width, height):
+            self.grid[cell].add(key)
+
+    def remove(self, key):
+        rect = self.rects.pop(key, None)
+        if rect is None:
+            return
+        for cell in self._cells(*rect):
+            keys = self.grid[cell]
+            keys.discard(key)
+            if not keys:
+                del self.grid[cell]
+
+    def log_stats(self):
+        logger.info("Pop-up placement: %d placed, %d within the overlap tolerance, %d live",
+                    self.placed, self.clear, len(self.rects))
@@ -0,0 +1,89 @@
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+LAG_HIGH = 0.10  # Seconds of event-loop lag that count as overload
+LAG_LOW = 0.03  # Lag below this counts as headroom
+LOST_HIGH = 0.05  # Fraction of dropped pictures that counts as overload
+LOST_LOW = 0.01
+BACKOFF = 1.5
+RECOVER = 0.9
+MAX_FACTOR = 8.0
+LOG_INTERVAL = 5.0  # Seconds between rate change log lines
+
+
+def read_media_stats(media):
+    import vlc  # Deferred so that importing this module does not load libVLC
+    stats = vlc.MediaStats()
+    if media is not None and media.get_stats(stats):
+        return stats
+    return None
+
+
+class PopupAdmission:
+    """Hard cap on live pop-up players plus an AIMD spawn-rate controller.
+
+    In adaptive mode the spawn interval is multiplied by a factor that grows
+    when the Tk loop lags or pop-ups drop frames, and decays back to 1 when
+    there is headroom again.
+    """
+
+    def __init__(self, max_live=6, adaptive=True):
+        self.max_live = max_live
+        self.adaptive = adaptive
+        self.factor = 1.0
+        self.expected_at = None
+        self.lag = 0.0
+        self.lost_ratio = 0.0
+        self.admitted = 0
+        self.deferred = 0
+        self.last_log = 0.0
+
+    def admit(self, live_count):
+        if live_count >= self.max_live:
+            self.deferred += 1
+            return False
+        self.admitted += 1
+        return True
+
+    def next_delay(self, interval):
+        delay = interval * self.factor
+        self.expected_at = time.monotonic() + delay
+        return int(delay * 1000)
+
+    def observe_tick(self):
+        if self.expected_at is not None:
+            self.lag = max(0.0, time.monotonic() - self.expected_at)
+
+    def observe_frames(self, windows):
+        # Dropped-picture ratio since the last tick across all live pop-up players
+        lost = shown = 0
+        for window in windows:
+            stats = read_media_stats(getattr(window, 'media', None))
+            if stats is None:
+                continue
+            last_lost, last_shown = getattr(window, 'frame_counts', (0, 0))
+            lost += stats.lost_pictures - last_lost
+            shown += stats.displayed_pictures - last_shown
+            window.frame_counts = (stats.lost_pictures, stats.displayed_pictures)
+        total = lost + shown
+        self.lost_ratio = lost / total if total > 0 else 0.0
+
+    def adjust(self):
+        if not self.adaptive:
+            return
+        previous = self.factor
+        if self.lag > LAG_HIGH or self.lost_ratio > LOST_HIGH:
+            self.factor = min(MAX_FACTOR, self.factor * BACKOFF)
+        elif self.lag < LAG_LOW and self.lost_ratio < LOST_LOW:
+            self.factor = max(1.0, self.factor * RECOVER)
+        now = time.monotonic()
+        if self.factor != previous and now - self.last_log >= LOG_INTERVAL:
+            self.last_log = now
+            logger.info("Pop-up spawn rate x%.2f (loop lag %.0f ms, dropped frames %.1f%%)",
+                        1 / self.factor, self.lag * 1000, self.lost_ratio * 100)
+
+    def log_stats(self):
+        logger.info("Pop-up admission: %d admitted, %d deferred at cap %d, final rate x%.2f",
+                    self.admitted, self.deferred, self.max_live, 1 / self.factor)
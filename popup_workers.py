@@ -0,0 +1,300 @@
+import logging
+import multiprocessing
+import time
+
+from playback_stats import COUNTERS
+
+logger = logging.getLogger(__name__)
+
+WORKER_POLL_MS = 20
+STATS_INTERVAL = 1.0  # Seconds between frame statistics reports from a worker
+RESTART_BACKOFF = 5.0  # Minimum seconds between a worker starting and being restarted
+STOP_TIMEOUT = 3.0
+STAT_FIELDS = COUNTERS + ("demux_bitrate",)
+
+
+class RemoteStats:
+    """The latest libVLC statistics a worker reported; stands in for a Media in read_media_stats()."""
+
+    def __init__(self):
+        self.values = None
+
+    def get_stats(self, stats):
+        if self.values is None:
+            return False
+        for name, value in self.values.items():
+            setattr(stats, name, value)
+        return True
+
+
+class RemotePopup:
+    """Main-process handle for a pop-up video hosted by a worker process."""
+
+    kind = "video"
+    remote = True
+
+    def __init__(self, popup_id, worker):
+        self.popup_id = popup_id
+        self.worker = worker
+        self.media = RemoteStats()
+
+
+class WorkerProcess:
+    def __init__(self, index, context, pool_size):
+        self.index = index
+        self.context = context
+        self.pool_size = pool_size
+        self.process = None
+        self.conn = None
+        self.popups = set()
+        self.started_at = 0.0
+        self.died_at = None
+
+    def start(self):
+        self.conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(target=worker_main, name=f"PopupWorker-{self.index}",
+                                            args=(child_conn, self.pool_size, logging.getLogger().level), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.started_at = time.monotonic()
+        self.died_at = None
+        self.popups = set()
+
+    def alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def send(self, message):
+        try:
+            self.conn.send(message)
+            return True
+        except (OSError, EOFError):
+            return False
+
+    def receive(self):
+        messages = []
+        try:
+            while self.conn.poll():
+                messages.append(self.conn.recv())
+        except (OSError, EOFError):
+            pass
+        return messages
+
+    def stop(self):
+        self.send(("stop",))
+        self.process.join(STOP_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+class PopupWorkerPool:
+    """Pop-up video windows hosted by a few worker processes, each with its own Tk and libVLC.
+
+    The main process sends ("show", ...) and ("hide", id) commands over a pipe
+    and gets frame statistics and log lines back. Workers that die are
+    restarted; their pop-ups are simply gone.
+    """
+
+    def __init__(self, processes, pool_size=4):
+        # Tk and libVLC state must not be inherited through fork
+        context = multiprocessing.get_context("spawn")
+        self.workers = [WorkerProcess(index, context, pool_size) for index in range(processes)]
+        self.popups = {}  # popup_id -> RemotePopup
+        self.next_id = 0
+        self.shown = 0
+        self.failed = 0
+        self.restarts = 0
+
+    def start(self):
+        for worker in self.workers:
+            worker.start()
+        logger.info("Started %d pop-up worker processes", len(self.workers))
+
+    def show(self, path, geometry, start_ms, options, bg):
+        live = [worker for worker in self.workers if worker.alive()]
+        if not live:
+            self.failed += 1
+            return None
+        worker = min(live, key=lambda w: len(w.popups))
+        popup_id = self.next_id
+        self.next_id += 1
+        if not worker.send(("show", popup_id, path, geometry, start_ms, options, bg)):
+            self.failed += 1
+            return None
+        popup = RemotePopup(popup_id, worker)
+        worker.popups.add(popup_id)
+        self.popups[popup_id] = popup
+        self.shown += 1
+        return popup
+
+    def hide(self, popup):
+        self.popups.pop(popup.popup_id, None)
+        if popup.popup_id in popup.worker.popups:
+            popup.worker.popups.discard(popup.popup_id)
+            popup.worker.send(("hide", popup.popup_id))
+
+    def poll(self):
+        """Handle worker messages and restart dead workers. Returns the pop-ups that are gone."""
+        lost = []
+        for worker in self.workers:
+            for message in worker.receive():
+                kind = message[0]
+                if kind == "stats":
+                    for popup_id, values in message[1].items():
+                        popup = self.popups.get(popup_id)
+                        if popup is not None:
+                            popup.media.values = values
+                elif kind == "error":
+                    self.failed += 1
+                    worker.popups.discard(message[1])
+                    lost.extend(self._forget([message[1]]))
+                    logger.error("Pop-up worker %d could not start a video: %s", worker.index, message[2])
+                elif kind == "log":
+                    logger.log(message[1], "Pop-up worker %d: %s", worker.index, message[2])
+            if not worker.alive():
+                if worker.died_at is None:
+                    worker.died_at = time.monotonic()
+                    logger.warning("Pop-up worker %d exited with code %s; %d pop-ups lost",
+                                   worker.index, worker.process.exitcode, len(worker.popups))
+                    lost.extend(self._forget(worker.popups))
+                    worker.popups.clear()
+                self._restart(worker)
+        return lost
+
+    def _forget(self, popup_ids):
+        popups = [self.popups.pop(popup_id, None) for popup_id in popup_ids]
+        return [popup for popup in popups if popup is not None]
+
+    def _restart(self, worker):
+        now = time.monotonic()
+        if now - worker.started_at < RESTART_BACKOFF:
+            return  # Died right after starting; don't restart it in a tight loop
+        worker.conn.close()
+        worker.start()
+        self.restarts += 1
+        logger.info("Restarted pop-up worker %d", worker.index)
+
+    def close(self):
+        for worker in self.workers:
+            if worker.process is not None:
+                worker.stop()
+
+    def log_stats(self):
+        logger.info("Pop-up workers: %d pop-ups shown, %d failed, %d restarts",
+                    self.shown, self.failed, self.restarts)
+
+
+class _PipeLogHandler(logging.Handler):
+    def __init__(self, conn):
+        super().__init__()
+        self.conn = conn
+
+    def emit(self, record):
+        try:
+            self.conn.send(("log", record.levelno, record.getMessage()))
+        except (OSError, ValueError):
+            pass
+
+
+def worker_main(conn, pool_size, log_level):
+    # Runs in a child process: its own Tk root, libVLC instance and pools
+    import tkinter as tk
+    import vlc
+    from event_bridge import EventBridge
+    from player_pool import PlayerPool
+    from playback_profiles import apply_options
+    from popup_scheduler import read_media_stats
+    from window_pool import PopupWindowPool
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_PipeLogHandler(conn))
+    root_logger.setLevel(log_level)
+
+    root = tk.Tk()
+    root.withdraw()
+    instance = vlc.Instance("--no-xlib", "--quiet")
+    players = PlayerPool(instance, max_size=pool_size)
+    windows = PopupWindowPool(root, size=pool_size)
+    bridge = EventBridge(root)
+    popups = {}  # popup_id -> (window, player, media, events)
+    state = {"running": True, "stats_at": time.monotonic()}
+
+    def on_event(popup_id, kind):
+        if kind == "end":
+            popups[popup_id][1].play()  # Loop the video
+        elif kind == "error":
+            hide(popup_id)
+            conn.send(("error", popup_id, "playback error"))
+
+    def show(popup_id, path, geometry, start_ms, options, bg):
+        window = windows.acquire("video", bg)
+        windows.show(window, *geometry)
+        try:
+            player = players.acquire()
+            media = instance.media_new_path(path)
+            apply_options(media, options)
+            player.set_media(media)
+            player.set_hwnd(window.video_frame.winfo_id())
+            events = bridge.subscribe(
+                player.event_manager(),
+                {vlc.EventType.MediaPlayerEndReached: "end", vlc.EventType.MediaPlayerEncounteredError: "error"},
+                lambda kind: on_event(popup_id, kind))
+            player.play()
+            if start_ms:
+                player.set_time(start_ms)
+            popups[popup_id] = (window, player, media, events)
+        except Exception as e:
+            windows.release(window)
+            conn.send(("error", popup_id, str(e)))
+
+    def hide(popup_id):
+        entry = popups.pop(popup_id, None)
+        if entry:
+            window, player, media, events = entry
+            bridge.unsubscribe(events)
+            players.release(player)
+            media.release()
+            windows.release(window)
+
+    def stop():
+        state["running"] = False
+        for popup_id in list(popups):
+            hide(popup_id)
+        bridge.stop()
+        players.log_stats()
+        players.close()
+        windows.close()
+        instance.release()
+        root.quit()
+
+    def poll():
+        try:
+            while conn.poll():
+                command, *args = conn.recv()
+                if command == "show":
+                    show(*args)
+                elif command == "hide":
+                    hide(*args)
+                elif command == "stop":
+                    stop()
+                    return
+        except (EOFError, OSError):
+            stop()  # The main process is gone
+            return
+        now = time.monotonic()
+        if now - state["stats_at"] >= STATS_INTERVAL:
+            state["stats_at"] = now
+            report = {}
+            for popup_id, (_, _, media, _) in popups.items():
+                stats = read_media_stats(media)
+                if stats is not None:
+                    report[popup_id] = {name: getattr(stats, name) for name in STAT_FIELDS}
+            if report:
+                conn.send(("stats", report))
+        if state["running"]:
+            root.after(WORKER_POLL_MS, poll)
+
+    bridge.start()
+    root.after(WORKER_POLL_MS, poll)
+    root.mainloop()
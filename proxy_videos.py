@@ -0,0 +1,173 @@
+import argparse
+import logging
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from app_config import load_config
+from app_logging import setup_logging
+from video_import import PART_SUFFIX, ContentHashIndex, hash_stream
+from video_scanner import parse_extensions
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_VIDEO_FOLDER = os.path.join(APP_DIR, "videos")
+CUSTOM_VIDEO_FOLDER = os.path.join(APP_DIR, "custom_videos")
+CONTENT_HASH_FILE = os.path.join(APP_DIR, "content_hashes.json")
+PROXY_DIR = os.path.join(APP_DIR, "proxies")
+
+# Small H.264 without CABAC or deblocking ("fastdecode"), one encoder thread
+# per file so the process pool spreads files across cores
+FFMPEG_VIDEO_ARGS = ["-c:v", "libx264", "-preset", "veryfast", "-tune", "fastdecode", "-crf", "28", "-threads", "1"]
+FFMPEG_AUDIO_ARGS = ["-c:a", "aac", "-b:a", "96k"]
+
+
+def popup_box(screen_width, screen_height, popup_video_size):
+    """Pop-up window size for a popup_video_size of 1-10; LockApp and the proxy generator both use it."""
+    return int(screen_width * popup_video_size / 20), int(screen_height * popup_video_size / 20)
+
+
+def proxy_name(digest, width, height):
+    return f"{digest}-{width}x{height}.mp4"
+
+
+class ProxyLibrary:
+    """Finds pre-generated pop-up proxies, keyed by source content hash and pop-up size.
+
+    Only digests already in the content hash index are used, so a lookup
+    costs two stat calls and never hashes a file.
+    """
+
+    def __init__(self, proxy_dir, hash_index):
+        self.proxy_dir = proxy_dir
+        self.hash_index = hash_index
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, source, width, height):
+        digest = self.hash_index.cached_hash(source)
+        if digest is not None:
+            path = os.path.join(self.proxy_dir, proxy_name(digest, width, height))
+            if os.path.exists(path):
+                self.hits += 1
+                return path
+        self.misses += 1
+        return None
+
+    def log_stats(self):
+        logger.info("Pop-up proxies: %d used, %d originals played", self.hits, self.misses)
+
+
+def transcode(source, target, width, height, ffmpeg="ffmpeg"):
+    part_path = target + PART_SUFFIX
+    scale = (f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+             "scale=trunc(iw/2)*2:trunc(ih/2)*2")
+    command = ([ffmpeg, "-v", "error", "-y", "-i", source, "-vf", scale] + FFMPEG_VIDEO_ARGS
+               + FFMPEG_AUDIO_ARGS + ["-movflags", "+faststart", "-f", "mp4", part_path])
+    try:
+        subprocess.run(command, check=True, capture_output=True, text=True)
+        os.replace(part_path, target)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+def build_proxy(source, digest, proxy_dir, width, height, ffmpeg):
+    # Runs in a worker process; hashes the source unless the index already knew it
+    if digest is None:
+        with open(source, 'rb') as stream:
+            digest = hash_stream(stream)
+    target = os.path.join(proxy_dir, proxy_name(digest, width, height))
+    if os.path.exists(target):
+        return digest, False
+    transcode(source, target, width, height, ffmpeg)
+    return digest, True
+
+
+def generate_proxies(sources, width, height, hash_index, proxy_dir=PROXY_DIR, workers=None, ffmpeg="ffmpeg"):
+    """Transcode every source that has no proxy of this size yet. Returns the proxy names in use."""
+    os.makedirs(proxy_dir, exist_ok=True)
+    created = reused = failed = 0
+    names = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_proxy, source, hash_index.cached_hash(source), proxy_dir, width, height, ffmpeg): source
+                   for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                digest, made = future.result()
+            except subprocess.CalledProcessError as e:
+                failed += 1
+                logger.error("ffmpeg failed for %s: %s", source, e.stderr.strip())
+                continue
+            except OSError as e:
+                failed += 1
+                logger.error("Error creating proxy for %s: %s", source, e)
+                continue
+            hash_index.add(source, digest)
+            names.add(proxy_name(digest, width, height))
+            if made:
+                created += 1
+                logger.info("Created %dx%d proxy for %s", width, height, os.path.basename(source))
+            else:
+                reused += 1
+    hash_index.save()
+    logger.info("Pop-up proxies at %dx%d: %d created, %d already present, %d failed",
+                width, height, created, reused, failed)
+    return names
+
+
+def prune_proxies(proxy_dir, keep):
+    removed = 0
+    for name in os.listdir(proxy_dir):
+        if name not in keep:
+            os.remove(os.path.join(proxy_dir, name))
+            removed += 1
+    logger.info("Removed %d stale pop-up proxies", removed)
+
+
+def screen_size():
+    import tkinter as tk
+    root = tk.Tk()
+    root.withdraw()
+    size = root.winfo_screenwidth(), root.winfo_screenheight()
+    root.destroy()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create small, fast-decoding copies of the videos for pop-up mode.")
+    parser.add_argument("--folder", help="video folder (default: the one the player uses)")
+    parser.add_argument("--screen", help="screen size as WIDTHxHEIGHT (default: this screen)")
+    parser.add_argument("--size", type=int, choices=range(1, 11), help="pop-up video size (default: from config.txt)")
+    parser.add_argument("--workers", type=int, help="parallel transcodes (default: one per core)")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg executable")
+    parser.add_argument("--prune", action="store_true", help="delete proxies not used by the current library and size")
+    args = parser.parse_args()
+
+    setup_logging()
+    if shutil.which(args.ffmpeg) is None:
+        parser.error(f"{args.ffmpeg} not found; install ffmpeg or pass --ffmpeg")
+    config = load_config()
+    folder = os.path.abspath(args.folder or (DEFAULT_VIDEO_FOLDER if config["use_default_videos"] else CUSTOM_VIDEO_FOLDER))
+    extensions = parse_extensions(config["video_extensions"])
+    if args.screen:
+        screen_width, screen_height = (int(value) for value in args.screen.lower().split("x"))
+    else:
+        screen_width, screen_height = screen_size()
+    width, height = popup_box(screen_width, screen_height, args.size or config["popup_video_size"])
+
+    sources = sorted(os.path.join(dirpath, name) for dirpath, _, names in os.walk(folder)
+                     for name in names if name.lower().endswith(extensions))
+    print(f"Creating {width}x{height} proxies for {len(sources)} videos in {folder}...")
+    names = generate_proxies(sources, width, height, ContentHashIndex(CONTENT_HASH_FILE),
+                             workers=args.workers, ffmpeg=args.ffmpeg)
+    print(f"{len(names)} of {len(sources)} videos have a proxy in {PROXY_DIR}")
+    if args.prune:
+        prune_proxies(PROXY_DIR, names)
+
+
+if __name__ == "__main__":
+    main()
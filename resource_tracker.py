@@ -0,0 +1,93 @@
+import collections
+import ctypes
+import logging
+import os
+import sys
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceTracker:
+    """Counts live libVLC objects, Toplevels and PhotoImages by kind.
+
+    Owners call track() when they create an object and release() when they
+    free it. Kinds tracked with explicit=True must be released by hand (libVLC
+    objects are not freed by the garbage collector); if one is collected
+    without release() it is counted as leaked. Other kinds are simply
+    untracked when the garbage collector frees them.
+    """
+
+    def __init__(self):
+        self.live = collections.defaultdict(dict)  # kind -> {id(obj): weakref}
+        self.explicit = set()
+        self.created = collections.Counter()
+        self.released = collections.Counter()
+        self.leaked = collections.Counter()
+
+    def track(self, kind, obj, explicit=True):
+        key = id(obj)
+        try:
+            ref = weakref.ref(obj, lambda _, kind=kind, key=key: self._collected(kind, key))
+        except TypeError:
+            ref = None  # Not weak-referenceable; counted until released
+        self.live[kind][key] = ref
+        if explicit:
+            self.explicit.add(kind)
+        self.created[kind] += 1
+        return obj
+
+    def release(self, kind, obj):
+        if id(obj) in self.live[kind]:
+            del self.live[kind][id(obj)]
+            self.released[kind] += 1
+
+    def _collected(self, kind, key):
+        # May run on any thread, whenever the last reference goes away
+        if self.live.get(kind, {}).pop(key, False) is not False:
+            if kind in self.explicit:
+                self.leaked[kind] += 1
+            else:
+                self.released[kind] += 1
+
+    def counts(self):
+        return {kind: len(objects) for kind, objects in sorted(self.live.items())}
+
+    def describe(self):
+        text = ", ".join(f"{count} {kind}" for kind, count in self.counts().items()) or "nothing tracked"
+        if self.leaked:
+            text += "; collected without release: " + ", ".join(
+                f"{count} {kind}" for kind, count in sorted(self.leaked.items()))
+        return text
+
+
+# One tracker per process, shared by the pools and LockApp
+resources = ResourceTracker()
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None where it can't be read."""
+    if sys.platform == "win32":
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        get_current_process = ctypes.windll.kernel32.GetCurrentProcess
+        get_current_process.restype = wintypes.HANDLE
+        get_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        if get_memory_info(get_current_process(), ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return None
+    try:
+        with open("/proc/self/statm", 'r') as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
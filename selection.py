@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import math
+import random
+from collections import deque
+from itertools import islice
+
+from app_config import save_json
+
+logger = logging.getLogger(__name__)
+
+REPEAT_RETRIES = 8  # Swaps tried before accepting a recently played item
+
+
+class RecentWindow:
+    """Last N picks, with O(1) membership checks. Can be shared by several bags."""
+
+    def __init__(self, size=10):
+        self.size = size
+        self.items = deque()
+        self.counts = {}
+
+    def add(self, item):
+        self.items.append(item)
+        self.counts[item] = self.counts.get(item, 0) + 1
+        while len(self.items) > self.size:
+            old = self.items.popleft()
+            self.counts[old] -= 1
+            if not self.counts[old]:
+                del self.counts[old]
+
+    def __contains__(self, item):
+        return item in self.counts
+
+    def played_within(self, item, count):
+        """Whether item is among the last count picks."""
+        if count >= len(self.items):
+            return item in self.counts
+        return item in self.counts and item in islice(reversed(self.items), count)
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r') as history_file:
+                for item in json.load(history_file)[-self.size:]:
+                    self.add(item)
+        except (OSError, ValueError) as e:
+            logger.error("Error loading play history: %s", e)
+
+    def save(self, path):
+        save_json(list(self.items), path, "play history")
+
+
+class ShuffleBag:
+    """Shuffle-bag picker: every item is drawn once per round, in random order.
+
+    weight(item) returns how many times an item goes into each round
+    (0 leaves it out); a fractional part is an extra copy in that share of
+    rounds, so 0.3 plays in about 3 rounds out of 10. Draws skip items still in the recent window when
+    another choice is available.
+    """
+
+    def __init__(self, items=(), weight=None, recent=None, rng=random):
+        self.weight = weight
+        self.recent = recent if recent is not None else RecentWindow()
+        self.rng = rng
+        self.items = []
+        self.bag = []
+        self.add(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def _copies(self, item):
+        if not self.weight:
+            return 1
+        weight = max(0.0, self.weight(item))
+        copies = math.floor(weight)
+        return copies + 1 if self.rng.random() < weight - copies else copies
+
+    def add(self, items):
+        # New items join the current round at random positions
+        for item in items:
+            self.items.append(item)
+            for _ in range(self._copies(item)):
+                self.bag.append(item)
+                j = self.rng.randrange(len(self.bag))
+                self.bag[j], self.bag[-1] = self.bag[-1], self.bag[j]
+
+    def _refill(self):
+        # The next round goes underneath the leftovers, so swaps near the end of
+        # a round still have non-recent items to choose from
+        next_round = [item for item in self.items for _ in range(self._copies(item))]
+        self.rng.shuffle(next_round)
+        self.bag = next_round + self.bag
+
+    def draw(self):
+        if len(self.bag) <= self.recent.size:
+            self._refill()
+            if not self.bag:
+                return None
+        # With no more items than the window, only the last len - 1 picks can be avoided
+        window = min(self.recent.size, len(self.items) - 1)
+        retries = REPEAT_RETRIES if window > 0 else 0
+        for _ in range(retries):
+            if not self.recent.played_within(self.bag[-1], window):
+                break
+            j = self.rng.randrange(len(self.bag))
+            self.bag[j], self.bag[-1] = self.bag[-1], self.bag[j]
+        if window > 0 and self.recent.played_within(self.bag[-1], 1):
+            # Never the same item twice in a row while there is anything else
+            for j in range(len(self.bag) - 2, -1, -1):
+                if self.bag[j] != self.bag[-1]:
+                    self.bag[j], self.bag[-1] = self.bag[-1], self.bag[j]
+                    break
+        item = self.bag.pop()
+        self.recent.add(item)
+        return item
+
+
+def load_weights(path):
+    weights = {}
+    try:
+        with open(path, 'r') as weights_file:
+            for line in weights_file:
+                if '=' in line:
+                    name, value = line.strip().rsplit('=', 1)
+                    weights[name.strip()] = float(value)
+    except (OSError, ValueError) as e:
+        logger.error("Error loading weights file %s: %s", path, e)
+    return weights
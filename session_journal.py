@@ -0,0 +1,147 @@
+import collections
+import json
+import logging
+import os
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+KEEP_JOURNALS = 20
+FLUSH_EVERY = 32  # Records buffered before a write reaches the file
+
+
+def session_rng(seed, stream):
+    """An independent, reproducible random stream per purpose.
+
+    Separate streams keep, say, the video order identical even when a replay
+    shows a different number of text pop-ups in between.
+    """
+    return random.Random(f"{seed}:{stream}")
+
+
+def new_seed():
+    return random.SystemRandom().randrange(1, 2 ** 31)
+
+
+class SessionJournal:
+    """Append-only JSON Lines record of one session's scheduling decisions.
+
+    The first line holds the seed and the config the session started with
+    (without the password). Every later line is [ms since start, kind, data].
+    """
+
+    def __init__(self, journal_dir, seed, config, replay_of=None):
+        os.makedirs(journal_dir, exist_ok=True)
+        prune_journals(journal_dir, KEEP_JOURNALS - 1)
+        self.path = os.path.join(journal_dir, time.strftime("session-%Y%m%d-%H%M%S") + f"-{os.getpid()}.jsonl")
+        self.file = open(self.path, 'a', encoding='utf-8')
+        self.started = time.monotonic()
+        self.buffered = 0
+        header = {"seed": seed, "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+                  "config": {key: value for key, value in config.items() if key != "password"}}
+        if replay_of:
+            header["replay_of"] = replay_of
+        self._write(header)
+        self.flush()
+        logger.info("Session journal: %s (seed %d)", self.path, seed)
+
+    def elapsed_ms(self):
+        return int((time.monotonic() - self.started) * 1000)
+
+    def record(self, kind, **data):
+        self._write([self.elapsed_ms(), kind, data])
+
+    def _write(self, item):
+        self.file.write(json.dumps(item, separators=(",", ":")) + "\n")
+        self.buffered += 1
+        if self.buffered >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        if self.buffered:
+            self.file.flush()
+            self.buffered = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def prune_journals(journal_dir, keep):
+    journals = sorted(name for name in os.listdir(journal_dir)
+                      if name.startswith("session-") and name.endswith(".jsonl"))
+    for name in journals[:max(0, len(journals) - keep)]:
+        os.remove(os.path.join(journal_dir, name))
+
+
+def load_journal(path):
+    """Returns (header, records). A last line cut short by a crash is ignored."""
+    records = []
+    with open(path, 'r', encoding='utf-8') as journal_file:
+        header = json.loads(journal_file.readline())
+        for line in journal_file:
+            try:
+                elapsed_ms, kind, data = json.loads(line)
+            except ValueError:
+                logger.warning("Ignoring an incomplete journal line in %s", path)
+                break
+            records.append((elapsed_ms, kind, data))
+    return header, records
+
+
+class SessionReplay:
+    """Re-drives a LockApp from a journal.
+
+    Pop-ups and config changes happen at their recorded times with their
+    recorded choices, and main videos play in the recorded order.
+    """
+
+    TIMED = ("video_popup", "text_popup", "config")
+
+    def __init__(self, path):
+        self.path = path
+        self.header, records = load_journal(path)
+        self.seed = self.header["seed"]
+        self.config = self.header["config"]
+        self.timed = [record for record in records if record[1] in self.TIMED]
+        self.main_videos = collections.deque(data["video"] for _, kind, data in records if kind == "main_video")
+        self.index = 0
+        self.started = None
+        self.app = None
+        self.job = None
+
+    def next_main_video(self):
+        return self.main_videos.popleft() if self.main_videos else None
+
+    def start(self, app, started):
+        """Replay relative to started, the monotonic time the new session began."""
+        self.app = app
+        self.started = started
+        logger.info("Replaying %d timed records from %s", len(self.timed), self.path)
+        self._schedule()
+
+    def stop(self):
+        if self.job is not None:
+            self.app.master.after_cancel(self.job)
+            self.job = None
+
+    def _schedule(self):
+        # One pending after() at a time, however long the journal is
+        if self.index >= len(self.timed):
+            self.job = None
+            logger.info("Replay finished")
+            return
+        elapsed_ms = (time.monotonic() - self.started) * 1000
+        self.job = self.app.master.after(max(0, int(self.timed[self.index][0] - elapsed_ms)), self._fire)
+
+    def _fire(self):
+        elapsed_ms = (time.monotonic() - self.started) * 1000
+        while self.index < len(self.timed) and self.timed[self.index][0] <= elapsed_ms:
+            _, kind, data = self.timed[self.index]
+            self.index += 1
+            try:
+                self.app.replay_record(kind, data)
+            except Exception as e:
+                logger.error("Error replaying %s record: %s", kind, e)
+        self._schedule()
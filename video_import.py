@@ -0,0 +1,230 @@
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import zipfile
+
+from app_config import save_json
+from video_scanner import DEFAULT_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+PART_SUFFIX = ".part"  # Never matches a video extension, so scanners skip it
+
+
+def hash_stream(stream, cancel_event=None, on_chunk=None):
+    digest = hashlib.sha256()
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            return digest.hexdigest()
+        digest.update(chunk)
+        if on_chunk:
+            on_chunk(chunk)
+
+
+class ContentHashIndex:
+    """SHA-256 of library files, cached on disk by path, size and mtime.
+
+    Files are only hashed when a candidate of the same size needs comparing.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r') as index_file:
+                self.entries = json.load(index_file)
+        except (OSError, ValueError) as e:
+            logger.error("Error loading content hash index: %s", e)
+
+    def save(self):
+        with self.lock:
+            entries = dict(self.entries)
+        save_json(entries, self.index_path, "content hash index")
+
+    def cached_hash(self, path):
+        """The stored digest if the file is unchanged since it was hashed, else None."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        entry = self.entries.get(path)
+        if entry and entry["size"] == st.st_size and entry["mtime"] == st.st_mtime_ns:
+            return entry["sha256"]
+        return None
+
+    def get_hash(self, path, cancel_event=None):
+        digest = self.cached_hash(path)
+        if digest is not None:
+            return digest
+        with open(path, 'rb') as stream:
+            digest = hash_stream(stream, cancel_event)
+        if digest is not None:
+            self.add(path, digest)
+        return digest
+
+    def add(self, path, digest):
+        st = os.stat(path)
+        with self.lock:
+            self.entries[path] = {"size": st.st_size, "mtime": st.st_mtime_ns, "sha256": digest}
+
+
+def library_sizes(folder, extensions):
+    sizes = {}
+    for dirpath, _, filenames in os.walk(folder):
+        for name in filenames:
+            if name.lower().endswith(extensions):
+                path = os.path.join(dirpath, name)
+                try:
+                    sizes.setdefault(os.path.getsize(path), []).append(path)
+                except OSError:
+                    continue
+    return sizes
+
+
+def unique_target(folder, name):
+    base, ext = os.path.splitext(name)
+    target = os.path.join(folder, name)
+    counter = 1
+    while os.path.exists(target) or os.path.exists(target + PART_SUFFIX):
+        target = os.path.join(folder, f"{base} ({counter}){ext}")
+        counter += 1
+    return target
+
+
+class ZipImporter:
+    """Extracts videos from a ZIP on a worker thread, skipping duplicates.
+
+    Members are streamed in chunks into "<name>.part" files and renamed into
+    place once complete. When the library already has files of the same size,
+    the member is hashed first and only extracted if its content is new.
+    Progress messages are posted to self.messages:
+    ("progress", done_bytes, total_bytes, name), ("done", imported, skipped, failed, cancelled)
+    and ("error", message). Members that can't be read (unsupported compression
+    such as Deflate64, encryption, corrupt data) are counted as failed.
+    """
+
+    def __init__(self, zip_path, dest_folder, hash_index, extensions=DEFAULT_EXTENSIONS):
+        self.zip_path = zip_path
+        self.dest_folder = dest_folder
+        self.hash_index = hash_index
+        self.extensions = tuple(extensions)
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker = None
+        self.done_bytes = 0
+
+    def start(self):
+        self.worker = threading.Thread(target=self._run, name="ZipImporter", daemon=True)
+        self.worker.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _run(self):
+        try:
+            imported, skipped, failed = self._import()
+            self.messages.put(("done", imported, skipped, failed, self.cancel_event.is_set()))
+        except Exception as e:
+            # The configurator waits for a final message, whatever went wrong
+            logger.error("Error importing %s: %s", self.zip_path, e)
+            self.messages.put(("error", str(e)))
+        finally:
+            self.hash_index.save()
+
+    def _import(self):
+        os.makedirs(self.dest_folder, exist_ok=True)
+        sizes = library_sizes(self.dest_folder, self.extensions)
+        imported = skipped = failed = 0
+        with zipfile.ZipFile(self.zip_path) as archive:
+            members = [info for info in archive.infolist()
+                       if not info.is_dir() and info.filename.lower().endswith(self.extensions)]
+            total = sum(info.file_size for info in members) or 1
+            for info in members:
+                if self.cancel_event.is_set():
+                    break
+                name = os.path.basename(info.filename)
+                start_bytes = self.done_bytes
+                try:
+                    result = self._import_member(archive, info, name, sizes, total, start_bytes)
+                except OSError:
+                    raise  # The destination is unusable (e.g. disk full); stop the whole import
+                except Exception as e:
+                    failed += 1
+                    self.done_bytes = start_bytes + info.file_size
+                    logger.error("Could not import %s: %s", name, e)
+                    continue
+                if result is None:
+                    break
+                if result:
+                    imported += 1
+                else:
+                    skipped += 1
+        logger.info("ZIP import of %s: %d imported, %d duplicates skipped, %d failed%s", self.zip_path,
+                    imported, skipped, failed, " (cancelled)" if self.cancel_event.is_set() else "")
+        return imported, skipped, failed
+
+    def _import_member(self, archive, info, name, sizes, total, start_bytes):
+        """Returns True if imported, False if skipped as a duplicate, None if cancelled."""
+        known = set()
+        for path in sizes.get(info.file_size, []):
+            digest = self.hash_index.get_hash(path, self.cancel_event)
+            if digest:
+                known.add(digest)
+
+        share = 1.0
+        if known:
+            # Same-size files exist: hash first, and only extract new content
+            with archive.open(info) as member:
+                digest = hash_stream(member, self.cancel_event,
+                                     lambda chunk: self._advance(len(chunk) / 2, total, name))
+            if digest is None:
+                return None
+            if digest in known:
+                self.done_bytes = start_bytes + info.file_size
+                logger.info("Skipped duplicate video %s", name)
+                return False
+            share = 0.5
+        target = unique_target(self.dest_folder, name)
+        digest = self._extract(archive, info, target, share, total, name)
+        if digest is None:
+            return None
+        self.done_bytes = start_bytes + info.file_size
+        self.hash_index.add(target, digest)
+        sizes.setdefault(info.file_size, []).append(target)
+        logger.info("Imported video %s", os.path.basename(target))
+        return True
+
+    def _extract(self, archive, info, target, share, total, name):
+        part_path = target + PART_SUFFIX
+        try:
+            with archive.open(info) as member, open(part_path, 'wb') as out:
+                def write_chunk(chunk):
+                    out.write(chunk)
+                    self._advance(len(chunk) * share, total, name)
+                digest = hash_stream(member, self.cancel_event, write_chunk)
+            if digest is None:
+                os.remove(part_path)
+                return None
+            os.replace(part_path, target)
+            return digest
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+    def _advance(self, amount, total, name):
+        self.done_bytes += amount
+        self.messages.put(("progress", self.done_bytes, total, name))
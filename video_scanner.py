@@ -0,0 +1,120 @@
+import json
+import logging
+import os
+import queue
+import threading
+
+from app_config import save_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+DEFAULT_EXTENSIONS = ('.mp4', '.avi', '.mkv', '.mov')
+
+
+def parse_extensions(value):
+    extensions = []
+    for ext in value.split(','):
+        ext = ext.strip().lower()
+        if ext:
+            extensions.append(ext if ext.startswith('.') else '.' + ext)
+    return tuple(extensions) or DEFAULT_EXTENSIONS
+
+
+class VideoScanner:
+    """Recursive video folder scanner backed by a per-directory manifest.
+
+    Runs on a worker thread and posts ("batch", paths) and ("done", count)
+    messages to self.results. Directories whose mtime matches the manifest
+    are not listed again.
+    """
+
+    def __init__(self, root, manifest_path, extensions=DEFAULT_EXTENSIONS, batch_size=25):
+        self.root = os.path.abspath(root)
+        self.manifest_path = manifest_path
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.batch_size = batch_size
+        self.results = queue.Queue()
+        self.worker = None
+        self.stopping = threading.Event()
+        self.listed_dirs = 0
+        self.cached_dirs = 0
+
+    def start(self):
+        self.worker = threading.Thread(target=self._run, name="VideoScanner", daemon=True)
+        self.worker.start()
+
+    def stop(self):
+        """Ask the worker to give up; a scan stopped early neither saves the manifest nor reports done."""
+        self.stopping.set()
+
+    def load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:
+                data = json.load(manifest_file)
+        except (OSError, ValueError) as e:
+            logger.error("Error loading video manifest: %s", e)
+            return {}
+        if data.get("version") != MANIFEST_VERSION or tuple(data.get("extensions", ())) != self.extensions:
+            return {}
+        return data.get("dirs", {})
+
+    def save_manifest(self, dirs):
+        data = {"version": MANIFEST_VERSION, "extensions": list(self.extensions), "dirs": dirs}
+        save_json(data, self.manifest_path, "video manifest")
+
+    def _list_dir(self, path):
+        files, subdirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name.lower().endswith(self.extensions) and entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+        return files, subdirs
+
+    def _run(self):
+        cached = self.load_manifest()
+        # Directories outside this root belong to the other video folder
+        dirs = {path: info for path, info in cached.items()
+                if not (path == self.root or path.startswith(self.root + os.sep))}
+        batch = []
+        total = 0
+        stack = [self.root]
+        while stack:
+            if self.stopping.is_set():
+                return
+            path = stack.pop()
+            try:
+                mtime = os.stat(path).st_mtime_ns
+                info = cached.get(path)
+                if info is not None and info["mtime"] == mtime:
+                    self.cached_dirs += 1
+                else:
+                    files, subdirs = self._list_dir(path)
+                    info = {"mtime": mtime, "files": files, "subdirs": subdirs}
+                    self.listed_dirs += 1
+            except OSError as e:
+                logger.warning("Skipping unreadable folder %s: %s", path, e)
+                continue
+            dirs[path] = info
+            for name in info["files"]:
+                batch.append(os.path.join(path, name))
+                # Hand over the very first file straight away so playback can start
+                if len(batch) >= (self.batch_size if total else 1):
+                    self.results.put(("batch", batch))
+                    total += len(batch)
+                    batch = []
+            stack.extend(os.path.join(path, name) for name in reversed(info["subdirs"]))
+        if batch:
+            self.results.put(("batch", batch))
+            total += len(batch)
+        self.save_manifest(dirs)
+        logger.info("Video scan of %s found %d files (%d folders listed, %d from manifest)",
+                    self.root, total, self.listed_dirs, self.cached_dirs)
+        self.results.put(("done", total))
@@ -0,0 +1,94 @@
+import logging
+import tkinter as tk
+from tkinter import ttk
+
+from resource_tracker import resources
+
+logger = logging.getLogger(__name__)
+
+STATS_EVERY = 200  # Checkouts between peak/idle log lines
+
+
+class PopupWindowPool:
+    """Pre-created, hidden borderless Toplevels recycled between pop-ups.
+
+    Each window carries a video frame and a text label; acquire() packs the
+    one the pop-up needs. Windows are shown with deiconify() and recycled
+    with withdraw() instead of being destroyed.
+    """
+
+    def __init__(self, master, size=8):
+        self.master = master
+        self.size = size
+        self.idle = []
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.acquired = 0
+        self.created = 0
+        self.destroyed = 0
+        for _ in range(size):
+            self.idle.append(self._create())
+
+    def _create(self):
+        window = tk.Toplevel(self.master)
+        window.withdraw()
+        window.overrideredirect(True)
+        window.attributes('-topmost', True)
+        window.video_frame = tk.Frame(window, bg='black')
+        window.text_label = ttk.Label(window)
+        window.kind = None
+        self.created += 1
+        return resources.track("toplevel", window)
+
+    def acquire(self, kind, bg):
+        window = self.idle.pop() if self.idle else self._create()
+        window.config(bg=bg)
+        window.kind = kind
+        if kind == "video":
+            window.video_frame.pack(fill="both", expand=True)
+        else:
+            window.text_label.pack(expand=True, fill='both')
+        self.in_use += 1
+        self.acquired += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        if self.acquired % STATS_EVERY == 0:
+            self.log_stats()
+        return window
+
+    def show(self, window, width, height, x, y):
+        window.geometry(f"{width}x{height}+{x}+{y}")
+        window.deiconify()
+        window.lift()
+
+    def release(self, window):
+        self.in_use -= 1
+        window.withdraw()
+        if window.kind == "video":
+            window.video_frame.pack_forget()
+        else:
+            window.text_label.pack_forget()
+        window.kind = None
+        if len(self.idle) < self.size:
+            self.idle.append(window)
+        else:
+            self.destroyed += 1
+            self._destroy(window)
+
+    def trim(self, keep):
+        """Destroy idle windows beyond keep."""
+        while len(self.idle) > keep:
+            self.destroyed += 1
+            self._destroy(self.idle.pop(0))
+
+    def close(self):
+        for window in self.idle:
+            self._destroy(window)
+        self.idle = []
+
+    def _destroy(self, window):
+        window.destroy()
+        resources.release("toplevel", window)
+
+    def log_stats(self):
+        logger.info("Pop-up window pool: %d in use, %d idle, peak %d, %d created, %d destroyed",
+                    self.in_use, len(self.idle), self.peak_in_use, self.created, self.destroyed)